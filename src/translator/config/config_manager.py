@@ -1,12 +1,13 @@
 """Configuration manager for application settings and environment variables."""
 
-import json
+import copy
 import logging
 import os
-from pathlib import Path
 from typing import Dict, Any, Optional
 
 from ..providers import PROVIDERS
+from ..utils import json_io
+from ..utils.paths import PROJECT_ROOT
 
 logger = logging.getLogger(__name__)
 
@@ -19,10 +20,12 @@ class ConfigManager:
     """
 
     def __init__(self):
-        project_root = Path(__file__).parent.parent.parent.parent
-        self.config_file = project_root / "translator_config.json"
-        self.last_session_file = project_root / "last_session.json"
-        self.env_file = project_root / ".env"
+        self.config_file = PROJECT_ROOT / "translator_config.json"
+        self.last_session_file = PROJECT_ROOT / "last_session.json"
+        self.env_file = PROJECT_ROOT / ".env"
+
+        # Parsed last_session.json, keyed on the file's (mtime_ns, size)
+        self._session_cache: Optional[tuple] = None
 
         openrouter = PROVIDERS['openrouter']
 
@@ -60,6 +63,7 @@ class ConfigManager:
                 "width": 1200,
                 "height": 800
             },
+            "window_geometry_b64": "",
             "compress_paragraphs": False,
             "context_filter_enabled": False,
             "context_filter_characters": False,
@@ -149,8 +153,7 @@ class ConfigManager:
     def load_config(self) -> Dict[str, Any]:
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                config = json_io.load_file(self.config_file)
 
                 merged_config = self.default_config.copy()
                 merged_config.update(config)
@@ -167,7 +170,7 @@ class ConfigManager:
                 self._inject_provider_env(default)
                 return default
 
-        except json.JSONDecodeError as e:
+        except json_io.JSONDecodeError as e:
             logger.error(f"Invalid JSON in config file: {e}", exc_info=True)
             return self._get_default_with_env()
         except Exception as e:
@@ -196,8 +199,7 @@ class ConfigManager:
                 if provider.api_key_config_key:
                     config_to_save.pop(provider.api_key_config_key, None)
 
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config_to_save, f, indent=2, ensure_ascii=False)
+            json_io.dump_file(self.config_file, config_to_save, indent=True)
 
             logger.info(f"Saved configuration to {self.config_file}")
             return True
@@ -211,8 +213,9 @@ class ConfigManager:
 
     def save_last_session(self, session_data: Dict[str, Any]) -> bool:
         try:
-            with open(self.last_session_file, 'w', encoding='utf-8') as f:
-                json.dump(session_data, f, indent=2, ensure_ascii=False)
+            # Machine-written state, so no indentation
+            json_io.dump_file(self.last_session_file, session_data)
+            self._session_cache = None
             logger.debug(f"Saved session data to {self.last_session_file}")
             return True
         except Exception as e:
@@ -220,14 +223,23 @@ class ConfigManager:
             return False
 
     def load_last_session(self) -> Optional[Dict[str, Any]]:
+        """Load the last session, returning a copy callers may modify."""
         try:
-            if self.last_session_file.exists():
-                with open(self.last_session_file, 'r', encoding='utf-8') as f:
-                    session = json.load(f)
-                logger.debug(f"Loaded session data from {self.last_session_file}")
-                return session
-            return None
-        except json.JSONDecodeError as e:
+            try:
+                st = os.stat(self.last_session_file)
+            except FileNotFoundError:
+                self._session_cache = None
+                return None
+
+            key = (st.st_mtime_ns, st.st_size)
+            if self._session_cache is not None and self._session_cache[0] == key:
+                return copy.deepcopy(self._session_cache[1])
+
+            session = json_io.load_file(self.last_session_file)
+            self._session_cache = (key, session)
+            logger.debug(f"Loaded session data from {self.last_session_file}")
+            return copy.deepcopy(session)
+        except json_io.JSONDecodeError as e:
             logger.error(f"Invalid JSON in session file: {e}", exc_info=True)
             return None
         except Exception as e:
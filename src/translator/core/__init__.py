@@ -1,17 +1,23 @@
 """Core business logic for the translator."""
 
-from .chapter_status import ChapterStatus
+from .chapter_list import AtomicChapterIter, LazyChapterList
+from .chapter_status import ChapterStatus, translated_chapter_numbers
 from .context_filter import ContextFilter
 from .context_manager import ContextManager
 from .epub_rebuilder import EpubRebuilder
 from .prompts import SYSTEM_PROMPT
+from .provider_scoreboard import ProviderScoreboard
 from .translation_worker import TranslationWorker
 
 __all__ = [
+    'AtomicChapterIter',
     'ChapterStatus',
     'ContextFilter',
     'ContextManager',
     'EpubRebuilder',
+    'LazyChapterList',
+    'ProviderScoreboard',
     'SYSTEM_PROMPT',
-    'TranslationWorker'
+    'TranslationWorker',
+    'translated_chapter_numbers'
 ]
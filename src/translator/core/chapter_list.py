@@ -0,0 +1,88 @@
+"""Chapter sequences: lazily decoded EPUB chapters and the workers' shared work list."""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+
+
+class LazyChapterList(Sequence):
+    """Read-only sequence of chapter XHTML strings, decoded on first access.
+
+    Holds references to the EPUB's HTML items and decodes an item's bytes
+    only when its index is read. The most recently used decodes are kept in
+    a bounded LRU cache, so memory tracks the chapters actually in use
+    rather than the whole book. Safe to share between worker threads.
+    """
+
+    def __init__(self, items, cache_size=64):
+        """Initialize the list.
+
+        Args:
+            items: ebooklib EpubHtml items, in chapter order
+            cache_size: Number of decoded chapters to keep
+        """
+        self._items = list(items)
+        self._cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self._items)))]
+        if index < 0:
+            index += len(self._items)
+        if not 0 <= index < len(self._items):
+            raise IndexError("chapter index out of range")
+        return self._get(index)
+
+    def _get(self, index):
+        with self._lock:
+            text = self._cache.get(index)
+            if text is not None:
+                self._cache.move_to_end(index)
+                return text
+
+        text = self._items[index].content.decode('utf-8')
+
+        with self._lock:
+            self._cache[index] = text
+            self._cache.move_to_end(index)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return text
+
+
+class AtomicChapterIter:
+    """Work list of chapter numbers shared by workers.
+
+    The list is fixed before any worker starts, so handing out the next entry
+    is just an index bump under one lock; there is nothing to wait on, unlike
+    queue.Queue's condition variable.
+    """
+
+    def __init__(self, entries):
+        """Initialize the work list.
+
+        Args:
+            entries: Iterable of chapter numbers, in dispatch order
+        """
+        self._entries = list(entries)
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Number of entries not yet handed out."""
+        with self._lock:
+            return len(self._entries) - self._next
+
+    def get_nowait(self):
+        """Return the next entry, or raise IndexError once all are taken."""
+        with self._lock:
+            index = self._next
+            if index >= len(self._entries):
+                raise IndexError("no chapters left")
+            self._next = index + 1
+        return self._entries[index]
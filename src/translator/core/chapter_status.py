@@ -1,12 +1,28 @@
 """Chapter status tracking for translation progress."""
 
 import logging
+import os
+import re
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
 
 logger = logging.getLogger(__name__)
 
+_CHAP_RE = re.compile(r'^(\d+)\.xhtml$')
+
+
+def translated_chapter_numbers(xhtml_dir: str) -> Set[int]:
+    """Return the chapter numbers that have an ``<n>.xhtml`` file in xhtml_dir.
+
+    Uses a single directory listing rather than one stat per chapter.
+    """
+    try:
+        names = os.listdir(xhtml_dir)
+    except FileNotFoundError:
+        return set()
+    return {int(m.group(1)) for m in map(_CHAP_RE.match, names) if m}
+
 
 class ChapterStatus:
     """Tracks the translation status and metadata for a single chapter.
@@ -21,6 +37,12 @@ class ChapterStatus:
         last_modified: Timestamp of last modification
     """
 
+    # One instance per chapter; slots drop the per-instance __dict__
+    __slots__ = (
+        'chapter_number', 'title', 'status', 'xhtml_exists',
+        'xhtml_path', 'file_size', 'last_modified',
+    )
+
     def __init__(self, chapter_number: int, title: str = ""):
         """Initialize chapter status.
 
@@ -36,11 +58,12 @@ class ChapterStatus:
         self.file_size = 0
         self.last_modified = ""
 
-    def update_status(self, xhtml_path: str = "") -> None:
+    def update_status(self, xhtml_path: str = "", exists: Optional[bool] = None) -> None:
         """Update status based on XHTML file existence.
 
         Args:
             xhtml_path: Path to the translated XHTML file
+            exists: Whether the file exists, if already known (skips the check)
         """
         self.xhtml_path = xhtml_path
 
@@ -50,7 +73,7 @@ class ChapterStatus:
             return
 
         path = Path(xhtml_path)
-        self.xhtml_exists = path.exists()
+        self.xhtml_exists = path.exists() if exists is None else exists
 
         if self.xhtml_exists:
             self.status = "Completed"
@@ -0,0 +1,62 @@
+"""Shared provider success tracking for failover ordering."""
+
+import threading
+import time
+from collections import defaultdict
+
+
+class ProviderScoreboard:
+    """Ranks upstream providers by how they have performed this session.
+
+    One instance is shared by every worker, so an outage seen while translating
+    one chapter reorders the provider list for the next instead of each chunk
+    stalling on the same failing provider first.
+    """
+
+    def __init__(self, cooldown=30.0):
+        """Initialize the scoreboard.
+
+        Args:
+            cooldown: Seconds a provider is skipped after a failure
+        """
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._stats = defaultdict(lambda: {'ok': 0, 'fail': 0, 'last_fail_ts': 0.0})
+
+    def record_success(self, provider):
+        with self._lock:
+            stats = self._stats[provider]
+            stats['ok'] += 1
+            # A success ends any failure cooldown
+            stats['last_fail_ts'] = 0.0
+
+    def record_failure(self, provider):
+        with self._lock:
+            stats = self._stats[provider]
+            stats['fail'] += 1
+            stats['last_fail_ts'] = time.monotonic()
+
+    def rank(self, providers):
+        """Order providers best-first, moving any still in failure cooldown last.
+
+        Providers are sorted by success ratio, then by oldest failure; the sort
+        is stable, so untried providers keep their configured order. Providers
+        cooling down are kept, ranked the same way, after all the others, so
+        they are still tried if everything else fails.
+        """
+        now = time.monotonic()
+        with self._lock:
+            snapshot = {p: dict(self._stats[p]) for p in providers if p in self._stats}
+
+        def cooling_down(provider):
+            stats = snapshot.get(provider)
+            return bool(stats and stats['last_fail_ts'] and now - stats['last_fail_ts'] < self.cooldown)
+
+        def score(provider):
+            stats = snapshot.get(provider)
+            if not stats:
+                return (0.0, 0.0)
+            ratio = stats['ok'] / (stats['ok'] + stats['fail'] + 1)
+            return (-ratio, stats['last_fail_ts'])
+
+        return sorted(providers, key=lambda p: (cooling_down(p), score(p)))
@@ -1,5 +1,6 @@
 """TOC translation worker for processing table of contents with context."""
 
+import gzip
 import json
 import re
 from PySide6.QtCore import QObject, Signal
@@ -16,7 +17,7 @@ class TocTranslationWorker(QObject):
     """Worker for translating TOC entries with context awareness."""
 
     update_progress = Signal(str, str)
-    raw_json_updated = Signal(str)
+    raw_json_updated = Signal(bytes)  # gzip-compressed UTF-8 text
     finished = Signal(bool, str)
     toc_item_translated = Signal(int, int, str, str)
 
@@ -258,8 +259,8 @@ class TocTranslationWorker(QObject):
                         "yellow"
                     )
 
-                response_text = ""
-                reasoning_text = ""
+                response_chunks: list[str] = []
+                reasoning_chunks: list[str] = []
 
                 try:
                     client = OpenAI(api_key=api_key, base_url=base_url, timeout=self.timeout)
@@ -351,7 +352,7 @@ class TocTranslationWorker(QObject):
                                             if not reasoning_started:
                                                 self.update_progress.emit("\n💭 [REASONING]\n", "gray")
                                                 reasoning_started = True
-                                            reasoning_text += reasoning_chunk
+                                            reasoning_chunks.append(reasoning_chunk)
                                             self.update_progress.emit(reasoning_chunk, "gray")
 
                                         content = getattr(choice.delta, 'content', None)
@@ -359,7 +360,7 @@ class TocTranslationWorker(QObject):
                                             if reasoning_started and not content_started:
                                                 self.update_progress.emit("\n📝 [RESPONSE]\n", "white")
                                                 content_started = True
-                                            response_text += content
+                                            response_chunks.append(content)
                                             self.update_progress.emit(content, "white")
                                 else:
                                     continue
@@ -381,6 +382,8 @@ class TocTranslationWorker(QObject):
 
                     self.update_progress.emit("\n" + "="*80 + "\n", "green")
 
+                    response_text = ''.join(response_chunks)
+                    reasoning_text = ''.join(reasoning_chunks)
                     last_response_text = response_text
 
                     cleaned_response = self.clean_json_response(response_text)
@@ -394,7 +397,9 @@ class TocTranslationWorker(QObject):
                         )
                     else:
                         combined_raw = cleaned_response
-                    self.raw_json_updated.emit(combined_raw)
+                    self.raw_json_updated.emit(
+                        gzip.compress(combined_raw.encode('utf-8'), compresslevel=1)
+                    )
 
                     parsed = json.loads(cleaned_response)
 
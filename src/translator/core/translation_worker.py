@@ -2,9 +2,10 @@
 
 import os
 import re
+import gzip
 import json
-import queue
 import threading
+from collections import deque
 import pypandoc
 from PySide6.QtCore import QObject, Signal
 from openai import OpenAI
@@ -13,6 +14,7 @@ from bs4 import BeautifulSoup
 from ..providers import PROVIDERS
 from .context_manager import ContextManager
 from .context_filter import ContextFilter
+from .provider_scoreboard import ProviderScoreboard
 from .prompts import (
     SYSTEM_PROMPT,
     CHARACTER_INSTRUCTION,
@@ -26,21 +28,69 @@ from .prompts import (
     TRANSLATION_INSTRUCTION,
     TOC_INSTRUCTION
 )
-from ..utils.token_counter import num_tokens_from_string, split_chapter
+from ..utils.token_counter import num_tokens_batch, split_chapter
+
+# Upper bound on progress messages buffered between worker and GUI. When the
+# GUI falls behind a bursty stream the oldest entries are dropped.
+PROGRESS_RING_SIZE = 256
+
+# Structural tokens for the pre-parse scan: whole string literals (so braces
+# inside them are skipped) or a single brace
+_JSON_SCAN_RE = re.compile(r'"(?:[^"\\]|\\.)*"|[{}]', re.DOTALL)
+_FENCED_JSON_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+_BARE_JSON_RE = re.compile(r'(\{.*\})', re.DOTALL)
+
+
+def _json_candidate(text):
+    """The part of a response that gets parsed as JSON, or None.
+
+    The last fenced JSON block wins; otherwise everything from the first `{`
+    to the last `}`.
+    """
+    blocks = _FENCED_JSON_RE.findall(text)
+    if blocks:
+        return blocks[-1]
+    match = _BARE_JSON_RE.search(text)
+    return match.group(1) if match else None
+
+
+def _looks_like_complete_json(buf):
+    """Cheap check that a response holds a closed JSON object with a translation.
+
+    Runs before the full parse so truncated output (timeouts, rate limits) is
+    rejected after one linear scan. Only the candidate that
+    extract_json_from_response would parse is scanned, so stray braces in
+    surrounding prose don't matter. Braces are balanced ignoring any inside
+    string literals; True once the outermost object closes and the
+    `"translation"` key appears in the candidate.
+    """
+    candidate = _json_candidate(buf)
+    if candidate is None or '"translation"' not in candidate:
+        return False
+    depth = 0
+    for match in _JSON_SCAN_RE.finditer(candidate):
+        token = match.group()
+        if token == '{':
+            depth += 1
+        elif token == '}':
+            depth -= 1
+            if depth == 0:
+                return True
+    return False
 
 
 class TranslationWorker(QObject):
     """Worker thread for translating chapters."""
 
     _toc_file_lock = threading.Lock()
+    _scoreboard = ProviderScoreboard()
 
-    update_progress = Signal(str, int, str)
     finished = Signal(int)
     characters_updated = Signal()
     places_updated = Signal()
     terms_updated = Signal()
     notes_updated = Signal()
-    raw_json_updated = Signal(str)
+    raw_json_updated = Signal(bytes)  # gzip-compressed UTF-8 text
     status_updated = Signal(int, int, int, int)
     chapter_completed = Signal(int)
     toc_entry_translated = Signal(int, str, str)  # chapter_number, original, translated
@@ -66,6 +116,10 @@ class TranslationWorker(QObject):
         self.send_previous_chunks = send_previous_chunks
         self.worker_id = worker_id
         self._is_running = True
+        # Progress messages are polled by the GUI (see take_progress) rather than
+        # emitted per token, so a fast stream can't flood the Qt event queue.
+        # deque.append/popleft are atomic, and maxlen drops the oldest on overflow.
+        self._emit_ring = deque(maxlen=PROGRESS_RING_SIZE)
         self.context_mode = context_mode
         self.notes_mode = notes_mode
         self.power_steering = power_steering
@@ -135,9 +189,9 @@ class TranslationWorker(QObject):
                     # Keys are strings from JSON, convert to int
                     self.toc_translations = {int(k): v for k, v in self.toc_translations.items()}
             except Exception as e:
-                self.update_progress.emit(
+                self._emit_progress(
                     f"⚠️ Warning: Could not load TOC translations: {e}\n",
-                    self.worker_id, "orange"
+                    "orange"
                 )
                 self.toc_translations = {}
 
@@ -155,9 +209,9 @@ class TranslationWorker(QObject):
                     with open(toc_path, 'r', encoding='utf-8') as f:
                         existing = {int(k): v for k, v in json.load(f).items()}
                 except Exception as e:
-                    self.update_progress.emit(
+                    self._emit_progress(
                         f"⚠️ Warning: Could not read existing TOC file: {e}\n",
-                        self.worker_id, "orange"
+                        "orange"
                     )
 
             # Merge: this worker's translations take priority for its chapters
@@ -184,6 +238,23 @@ class TranslationWorker(QObject):
         """Stop the worker."""
         self._is_running = False
 
+    def _emit_progress(self, text, color):
+        """Queue a progress message for the GUI."""
+        self._emit_ring.append((text, self.worker_id, color))
+
+    def take_progress(self, max_items=None):
+        """Pop up to max_items queued progress messages (all if None).
+
+        Returns a list of (text, worker_id, color) tuples, oldest first.
+        """
+        items = []
+        while max_items is None or len(items) < max_items:
+            try:
+                items.append(self._emit_ring.popleft())
+            except IndexError:
+                break
+        return items
+
     def _setup_context_filter(self):
         self._context_filter = ContextFilter()
         filter_chars = self.embedding_config.get('filter_characters', False)
@@ -207,26 +278,26 @@ class TranslationWorker(QObject):
             filter_types.append("terms")
 
         types_str = ", ".join(filter_types) if filter_types else "none"
-        self.update_progress.emit(
+        self._emit_progress(
             f"✅ Context filtering enabled for: {types_str}\n",
-            self.worker_id, "green"
+            "green"
         )
 
     def run(self):
         """Main worker loop."""
         try:
-            while self._is_running and not self.chapter_queue.empty():
+            while self._is_running:
                 try:
-                    chapter_number, chapter = self.chapter_queue.get_nowait()
-                except queue.Empty:
+                    chapter_number = self.chapter_queue.get_nowait()
+                except IndexError:
                     break
 
-                self.translate_chapter(chapter_number, chapter)
-                self.chapter_queue.task_done()
+                # Decoded only now, so just the chapters in flight are resident
+                self.translate_chapter(chapter_number, self.all_chapters[chapter_number - 1])
 
             self.finished.emit(self.worker_id)
         except Exception as e:
-            self.update_progress.emit(f"Error: {str(e)}", self.worker_id, "red")
+            self._emit_progress(f"Error: {str(e)}", "red")
             self.finished.emit(self.worker_id)
 
     def load_previous_chapters(self, chapter_number):
@@ -252,9 +323,9 @@ class TranslationWorker(QObject):
                         extra_args=['--wrap=preserve']
                     )
                 except Exception as e:
-                    self.update_progress.emit(
+                    self._emit_progress(
                         f"⚠️ Pandoc failed converting previous chapter {i}: {e}\n",
-                        self.worker_id, "orange"
+                        "orange"
                     )
                     continue
 
@@ -282,22 +353,19 @@ class TranslationWorker(QObject):
                             'translated': translated_markdown.strip()
                         })
 
-                        self.update_progress.emit(
+                        self._emit_progress(
                             f"✓ Loaded previous chapter {i} for context\n",
-                            self.worker_id,
                             "green"
                         )
                     except Exception as e:
-                        self.update_progress.emit(
+                        self._emit_progress(
                             f"⚠ Error reading previous chapter {i}: {str(e)}\n",
-                            self.worker_id,
                             "orange"
                         )
 
         if self.previous_chapter_pairs:
-            self.update_progress.emit(
+            self._emit_progress(
                 f"📚 Using {len(self.previous_chapter_pairs)} previous chapters for context\n",
-                self.worker_id,
                 "blue"
             )
 
@@ -378,13 +446,14 @@ class TranslationWorker(QObject):
             )
         except Exception as e:
             import traceback
-            self.update_progress.emit(
+            self._emit_progress(
                 f"❌ Pandoc conversion failed for chapter {chapter_number}: {e}\n{traceback.format_exc()}",
-                self.worker_id, "red"
+                "red"
             )
             return
 
         chunks = split_chapter(chapter_markdown, max_tokens=self.max_tokens_per_chunk)
+        chunk_token_counts = num_tokens_batch(chunks, 'cl100k_base')
         total_chunks = len(chunks)
         translated_chunks = []
         all_chunks_successful = True
@@ -394,17 +463,15 @@ class TranslationWorker(QObject):
         current_chapter_chunks = []
         current_chapter_translations = []
 
-        for i, chunk in enumerate(chunks, start=1):
+        for i, (chunk, chunk_tokens) in enumerate(zip(chunks, chunk_token_counts), start=1):
             if not self._is_running:
                 all_chunks_successful = False
                 break
 
             self.status_updated.emit(self.worker_id, chapter_number, i, total_chunks)
 
-            chunk_tokens = num_tokens_from_string(chunk, 'cl100k_base')
-            self.update_progress.emit(
+            self._emit_progress(
                 f"\n--- Translating Chapter {chapter_number}, Chunk {i}/{total_chunks} ({chunk_tokens} tokens) ---\n",
-                self.worker_id,
                 "black"
             )
 
@@ -430,17 +497,15 @@ class TranslationWorker(QObject):
             if chapter_number in self.toc_translations:
                 self._save_toc_translations()
 
-            self.update_progress.emit(
+            self._emit_progress(
                 f"\n\n✅ Chapter {chapter_number} completed successfully!\n",
-                self.worker_id,
                 "green"
             )
 
             self.chapter_completed.emit(chapter_number)
         else:
-            self.update_progress.emit(
+            self._emit_progress(
                 f"\n\n❌ Chapter {chapter_number} translation failed or incomplete. File not created.\n",
-                self.worker_id,
                 "red"
             )
 
@@ -567,39 +632,35 @@ class TranslationWorker(QObject):
                 # Write with XML declaration
                 f.write(str(soup))
 
-            self.update_progress.emit(
+            self._emit_progress(
                 f"✅ Created XHTML file: {output_file}\n",
-                self.worker_id, "green"
+                "green"
             )
 
         except Exception as e:
             import traceback
-            self.update_progress.emit(
+            self._emit_progress(
                 f"❌ Error creating XHTML for chapter {chapter_number}: {str(e)}\n{traceback.format_exc()}",
-                self.worker_id, "red"
+                "red"
             )
 
     def extract_json_from_response(self, response_text):
         """Extract JSON data from API response."""
         try:
-            json_blocks = re.findall(r'```(?:json)?\s*(\{.*?\})\s*```', response_text, re.DOTALL)
-            if json_blocks:
-                return json.loads(json_blocks[-1])
-
-            json_match = re.search(r'(\{.*\})', response_text, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group(1))
+            candidate = _json_candidate(response_text)
+            if candidate is not None:
+                return json.loads(candidate)
 
             return None
         except json.JSONDecodeError as e:
-            self.update_progress.emit(f"\nJSON Parse Error: {str(e)}\n", self.worker_id, "red")
+            self._emit_progress(f"\nJSON Parse Error: {str(e)}\n", "red")
             return None
 
     def translate_chunk(self, chunk, current_chapter_chunks, current_chapter_translations,
                         chapter_number=None, chunk_index=1):
         """Translate a single chunk of text."""
         if not self.endpoint_config['api_key']:
-            self.update_progress.emit("❌ Error: No API key provided\n", self.worker_id, "red")
+            self._emit_progress("❌ Error: No API key provided\n", "red")
             return None
 
         # Build the base messages with conditional JSON instruction placement
@@ -630,25 +691,25 @@ class TranslationWorker(QObject):
                 place_str = f"{len(match_details['places'])}/{total_places_db}" if filter_places else f"all {total_places_db}"
                 term_str = f"{len(match_details['terms'])}/{total_terms_db}" if filter_terms else f"all {total_terms_db}"
 
-                self.update_progress.emit(
+                self._emit_progress(
                     f"🔍 Context Filter: {char_str} chars, {place_str} places, {term_str} terms\n",
-                    self.worker_id, "blue"
+                    "blue"
                 )
 
                 if match_details['characters']:
                     char_info = ", ".join([f"{orig}→{trans} ['{matched}' {mtype}]"
                                           for orig, trans, matched, mtype in match_details['characters'][:5]])
-                    self.update_progress.emit(f"  📌 Chars: {char_info}\n", self.worker_id, "blue")
+                    self._emit_progress(f"  📌 Chars: {char_info}\n", "blue")
 
                 if match_details['places']:
                     place_info = ", ".join([f"{orig}→{trans} ['{matched}' {mtype}]"
                                            for orig, trans, matched, mtype in match_details['places'][:5]])
-                    self.update_progress.emit(f"  📍 Places: {place_info}\n", self.worker_id, "blue")
+                    self._emit_progress(f"  📍 Places: {place_info}\n", "blue")
 
                 if match_details['terms']:
                     term_info = ", ".join([f"{orig}→{trans} ['{matched}' {mtype}]"
                                           for orig, trans, matched, mtype in match_details['terms'][:5]])
-                    self.update_progress.emit(f"  ⚔️ Terms: {term_info}\n", self.worker_id, "blue")
+                    self._emit_progress(f"  ⚔️ Terms: {term_info}\n", "blue")
 
             else:
                 char_prompt = self.context_manager.get_character_prompt()
@@ -669,8 +730,8 @@ class TranslationWorker(QObject):
 
         # Add previous chapters context
         if self.send_previous and self.previous_chapter_pairs:
-            self.update_progress.emit(f"📖 Including {len(self.previous_chapter_pairs)} previous chapters as context\n",
-                                      self.worker_id, "blue")
+            self._emit_progress(f"📖 Including {len(self.previous_chapter_pairs)} previous chapters as context\n",
+                                      "blue")
             for prev_chapter in self.previous_chapter_pairs:
                 base_messages.append({
                     "role": "user",
@@ -685,9 +746,9 @@ class TranslationWorker(QObject):
 
         # Add current chapter's previous chunks for immediate context
         if self.send_previous_chunks and current_chapter_chunks:
-            self.update_progress.emit(
+            self._emit_progress(
                 f"🔗 Including {len(current_chapter_chunks)} previous chunks from current chapter\n",
-                self.worker_id, "blue")
+                "blue")
             for prev_chunk, prev_trans in zip(current_chapter_chunks, current_chapter_translations):
                 base_messages.append({
                     "role": "user",
@@ -722,10 +783,10 @@ class TranslationWorker(QObject):
 
             bundled_context_parts.append("\n".join(toc_block_parts))
 
-            self.update_progress.emit(
+            self._emit_progress(
                 f"📑 Including {len(toc_entries)} TOC entries for inline translation"
                 + (f" (with {len(prev_toc)} previous for consistency)" if prev_toc else "") + "\n",
-                self.worker_id, "blue"
+                "blue"
             )
 
         # Build instruction
@@ -768,9 +829,9 @@ class TranslationWorker(QObject):
                     translated = entry.get('translated', '')
                     if original and translated:
                         self.toc_entry_translated.emit(chapter_number, original, translated)
-                        self.update_progress.emit(
+                        self._emit_progress(
                             f"📑 TOC: {original} → {translated}\n",
-                            self.worker_id, "green"
+                            "green"
                         )
 
         return result
@@ -1038,6 +1099,20 @@ class TranslationWorker(QObject):
         provider_list = provider_obj.get_provider_list(self.providers)
         endpoint_label = provider_obj.display_name
 
+        # Try recently successful providers first and ones that just failed last
+        if len(provider_list) > 1:
+            ranked = TranslationWorker._scoreboard.rank(provider_list)
+            if ranked != provider_list:
+                self._emit_progress(
+                    f"🔀 Provider order by recent results: {', '.join(ranked)}\n",
+                    "blue"
+                )
+            provider_list = ranked
+
+        # What was actually attempted, for the final error message
+        attempts_made = 0
+        providers_tried = []
+
         # Iterate through each provider
         for provider_index, current_provider in enumerate(provider_list):
             if not self._is_running:
@@ -1049,15 +1124,18 @@ class TranslationWorker(QObject):
                     break
 
                 attempt_num = retry_attempt + 1
+                attempts_made += 1
+                if retry_attempt == 0:
+                    providers_tried.append(current_provider)
                 if current_provider:
-                    self.update_progress.emit(
+                    self._emit_progress(
                         f"\n🔄 Provider {provider_index + 1}/{len(provider_list)}: {current_provider} - Attempt {attempt_num}/{self.retries_per_provider}\n",
-                        self.worker_id, "blue"
+                        "blue"
                     )
                 else:
-                    self.update_progress.emit(
+                    self._emit_progress(
                         f"\n🔄 {endpoint_label} - Attempt {attempt_num}/{self.retries_per_provider}\n",
-                        self.worker_id, "blue"
+                        "blue"
                     )
 
                 # Create a fresh copy of base messages for this attempt
@@ -1102,8 +1180,10 @@ class TranslationWorker(QObject):
                     )
 
                     # Collect response from this provider/endpoint
-                    current_response = ""
-                    reasoning_text = ""
+                    # Accumulate deltas in lists and join once after the stream;
+                    # repeated `+=` on a growing str is quadratic
+                    response_chunks: list[str] = []
+                    reasoning_chunks: list[str] = []
                     chunk_count = 0
                     reasoning_started = False
                     content_started = False
@@ -1131,27 +1211,27 @@ class TranslationWorker(QObject):
                                         )
                                         if reasoning_chunk:
                                             if not reasoning_started:
-                                                self.update_progress.emit(
+                                                self._emit_progress(
                                                     "\n💭 [REASONING]\n",
-                                                    self.worker_id, "gray"
+                                                    "gray"
                                                 )
                                                 reasoning_started = True
-                                            reasoning_text += reasoning_chunk
-                                            self.update_progress.emit(
-                                                reasoning_chunk, self.worker_id, "gray"
+                                            reasoning_chunks.append(reasoning_chunk)
+                                            self._emit_progress(
+                                                reasoning_chunk, "gray"
                                             )
 
                                         # Content chunk (the actual translation JSON)
                                         content = getattr(choice.delta, 'content', None)
                                         if content:
                                             if reasoning_started and not content_started:
-                                                self.update_progress.emit(
+                                                self._emit_progress(
                                                     "\n📝 [RESPONSE]\n",
-                                                    self.worker_id, "blue"
+                                                    "blue"
                                                 )
                                                 content_started = True
-                                            current_response += content
-                                            self.update_progress.emit(content, self.worker_id, "blue")
+                                            response_chunks.append(content)
+                                            self._emit_progress(content, "blue")
                                 else:
                                     continue
 
@@ -1159,31 +1239,43 @@ class TranslationWorker(QObject):
                                 continue
 
                     except Exception as stream_error:
-                        self.update_progress.emit(
+                        self._emit_progress(
                             f"\n⚠️ Stream error: {str(stream_error)}, but may have received complete response\n",
-                            self.worker_id, "orange"
+                            "orange"
                         )
 
+                    current_response = ''.join(response_chunks)
+                    reasoning_text = ''.join(reasoning_chunks)
+
                     # Log how many chunks were processed
                     if chunk_count > 0:
-                        self.update_progress.emit(
+                        self._emit_progress(
                             f"\n📊 Processed {chunk_count} stream chunks\n",
-                            self.worker_id, "blue"
+                            "blue"
                         )
 
-                    # Try to parse the complete response
-                    json_data = self.extract_json_from_response(current_response)
+                    # Try to parse the complete response, skipping the full parse
+                    # when the output is obviously truncated
+                    if _looks_like_complete_json(current_response):
+                        json_data = self.extract_json_from_response(current_response)
+                    else:
+                        json_data = None
+                        self._emit_progress(
+                            "\n⚠️ Truncated output (incomplete JSON), skipping parse\n",
+                            "orange"
+                        )
 
                     if json_data and 'translation' in json_data:
                         if current_provider:
-                            self.update_progress.emit(
+                            TranslationWorker._scoreboard.record_success(current_provider)
+                            self._emit_progress(
                                 f"\n✅ Successfully got response from provider: {current_provider}\n",
-                                self.worker_id, "green"
+                                "green"
                             )
                         else:
-                            self.update_progress.emit(
+                            self._emit_progress(
                                 f"\n✅ Successfully got response from {endpoint_label}\n",
-                                self.worker_id, "green"
+                                "green"
                             )
 
                         # Emit the raw JSON response, prepending reasoning when captured
@@ -1196,7 +1288,11 @@ class TranslationWorker(QObject):
                             )
                         else:
                             combined_raw = current_response
-                        self.raw_json_updated.emit(combined_raw)
+                        # Compressed at level 1: cheap to produce and shrinks the
+                        # queued signal payload several-fold for large chapters
+                        self.raw_json_updated.emit(
+                            gzip.compress(combined_raw.encode('utf-8'), compresslevel=1)
+                        )
 
                         # Update all lists based on enabled modes
                         if self.context_mode:
@@ -1213,7 +1309,7 @@ class TranslationWorker(QObject):
                         if self.notes_mode and 'notes' in json_data:
                             self.context_manager.update_notes(
                                 json_data['notes'],
-                                update_callback=lambda msg: self.update_progress.emit(f"{msg}\n", self.worker_id, "blue")
+                                update_callback=lambda msg: self._emit_progress(f"{msg}\n", "blue")
                             )
                             self.notes_updated.emit()
 
@@ -1223,43 +1319,47 @@ class TranslationWorker(QObject):
                         return json_data['translation']
 
                     # If we didn't get valid JSON, retry or move to next provider
+                    if current_provider:
+                        TranslationWorker._scoreboard.record_failure(current_provider)
                     if retry_attempt < self.retries_per_provider - 1:
                         # Still have retries left for this provider
                         source = current_provider if current_provider else endpoint_label
                         retry_notice = f"\n⚠️ Invalid JSON response from {source}, retrying...\n"
-                        self.update_progress.emit(retry_notice, self.worker_id, "orange")
+                        self._emit_progress(retry_notice, "orange")
                     else:
                         # No more retries for this provider, will move to next
                         if current_provider and provider_index < len(provider_list) - 1:
                             retry_notice = f"\n⚠️ Invalid JSON response from {current_provider} after {self.retries_per_provider} attempts, moving to next provider...\n"
-                            self.update_progress.emit(retry_notice, self.worker_id, "orange")
+                            self._emit_progress(retry_notice, "orange")
 
                 except Exception as e:
+                    if current_provider:
+                        TranslationWorker._scoreboard.record_failure(current_provider)
                     error_source = current_provider if current_provider else endpoint_label
-                    self.update_progress.emit(
+                    self._emit_progress(
                         f"\n❌ Error with {error_source}: {str(e)}\n",
-                        self.worker_id, "red"
+                        "red"
                     )
 
                     # Check if we should retry or move to next provider
                     if retry_attempt < self.retries_per_provider - 1:
-                        self.update_progress.emit(f"🔄 Retrying same provider...\n", self.worker_id, "orange")
+                        self._emit_progress(f"🔄 Retrying same provider...\n", "orange")
                     elif provider_index < len(provider_list) - 1:
-                        self.update_progress.emit(f"🔄 Moving to next provider...\n", self.worker_id, "orange")
+                        self._emit_progress(f"🔄 Moving to next provider...\n", "orange")
 
         # All attempts failed
         if endpoint_type == 'openrouter':
-            total_attempts = len(self.providers) * self.retries_per_provider
-            self.update_progress.emit(
-                f"\n\n💥 ERROR: Failed to get valid translation after {total_attempts} total attempts "
+            tried = ', '.join(p for p in providers_tried if p) or endpoint_label
+            self._emit_progress(
+                f"\n\n💥 ERROR: Failed to get valid translation after {attempts_made} total attempts "
                 f"({self.retries_per_provider} retries per provider).\n"
-                f"Providers tried: {', '.join(self.providers)}\n",
-                self.worker_id, "red"
+                f"Providers tried: {tried}\n",
+                "red"
             )
         else:
-            self.update_progress.emit(
+            self._emit_progress(
                 f"\n\n💥 ERROR: Failed to get valid translation from {endpoint_label} "
                 f"after {self.retries_per_provider} attempts.\n",
-                self.worker_id, "red"
+                "red"
             )
         return None
@@ -1,13 +1,69 @@
 """Chapter overview widget for tracking translation progress."""
 
+import html
 import os
-from typing import Dict
+import re
+from typing import Dict, List, Optional
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
                              QTableWidget, QTableWidgetItem, QMessageBox, QFileDialog,
                              QProgressBar, QApplication)
 from PySide6.QtGui import QFont, QColor
 
-from ..core.chapter_status import ChapterStatus
+from ..core.chapter_status import ChapterStatus, translated_chapter_numbers
+from ..utils.epub_manifest import save_manifest
+from ..utils.paths import PROJECT_ROOT
+
+_TITLE_RE = re.compile(r'<(h1|h2|title)\b[^>]*>(.*?)</\1\s*>', re.I | re.S)
+_TITLE_PRIORITY = {'h1': 0, 'h2': 1, 'title': 2}
+_TAG_RE = re.compile(r'<[^>]+>')
+_FIRST_LINE_RE = re.compile(r'^[^\n]{1,100}', re.M)
+
+
+def extract_chapter_title(chapter: str) -> str:
+    """Guess a display title from chapter XHTML (first h1/h2/title, else first line)."""
+    # Look for common title patterns, preferring h1 over h2 over title
+    best = None
+    for m in _TITLE_RE.finditer(chapter):
+        rank = _TITLE_PRIORITY[m.group(1).lower()]
+        if best is None or rank < best[0]:
+            best = (rank, m.group(2))
+            if rank == 0:
+                break
+    if best is not None:
+        title = html.unescape(_TAG_RE.sub('', best[1])).strip()[:50]
+        if title:
+            return title
+
+    # Try to get first line as title
+    text = html.unescape(_TAG_RE.sub('', chapter)).strip()
+    m = _FIRST_LINE_RE.search(text)
+    return m.group(0).strip()[:50] if m else ""
+
+
+class _TitleSignals(QObject):
+    """Signal carrier for TitleExtractJob (QRunnable can't declare signals)."""
+
+    title_ready = Signal(int, int, str)  # generation, chapter_number, title
+
+
+class TitleExtractJob(QRunnable):
+    """Extracts one chapter title on a QThreadPool thread."""
+
+    def __init__(self, generation: int, chapter_number: int, chapters, signals: _TitleSignals):
+        super().__init__()
+        self.generation = generation
+        self.chapter_number = chapter_number
+        self.chapters = chapters
+        self.signals = signals
+
+    def run(self):
+        try:
+            # Read here so lazily decoded chapters decode on the pool thread
+            title = extract_chapter_title(self.chapters[self.chapter_number - 1])
+        except Exception:
+            title = ""
+        self.signals.title_ready.emit(self.generation, self.chapter_number, title)
 
 
 class ChapterOverviewWidget(QWidget):
@@ -17,6 +73,14 @@ class ChapterOverviewWidget(QWidget):
         super().__init__(parent)
         self.parent_app = parent
         self.chapter_statuses: Dict[int, ChapterStatus] = {}
+
+        # Title extraction runs on the thread pool; the generation counter
+        # discards results from a previously loaded EPUB
+        self._title_generation = 0
+        self._titles_pending = 0
+        self._title_signals = _TitleSignals(self)
+        self._title_signals.title_ready.connect(self._on_title_ready)
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -66,50 +130,67 @@ class ChapterOverviewWidget(QWidget):
         layout.addWidget(self.chapter_table)
         self.setLayout(layout)
 
-    def update_epub_info(self, epub_path: str, chapters: list, epub_name: str):
-        """Update chapter information when EPUB is loaded."""
+    def update_epub_info(self, epub_path: str, chapters: list, epub_name: str,
+                         titles: Optional[List[str]] = None):
+        """Update chapter information when EPUB is loaded.
+
+        If titles are already known (one per chapter) they are used as-is;
+        otherwise they are extracted on the thread pool and written to the
+        EPUB's manifest cache once every chapter has reported.
+        """
         self.epub_path = epub_path
         self.chapters = chapters
         self.epub_name = epub_name
-        self.output_folder = os.path.join(os.path.dirname(__file__), "..", "..", "..", f"{epub_name}_translated")
-
-        # Initialize chapter statuses
-        self.chapter_statuses = {}
-        for i, chapter in enumerate(chapters, 1):
-            # Try to extract title from chapter content
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(chapter, 'html.parser')
-            title = ""
-            # Look for common title patterns
-            for tag in ['h1', 'h2', 'title']:
-                title_elem = soup.find(tag)
-                if title_elem:
-                    title = title_elem.get_text().strip()[:50]
-                    break
-
-            if not title:
-                # Try to get first line as title
-                text = soup.get_text().strip()
-                if text:
-                    first_line = text.split('\n')[0].strip()[:50]
-                    if len(first_line) < 100:
-                        title = first_line
-
-            self.chapter_statuses[i] = ChapterStatus(i, title)
+        self.output_folder = str(PROJECT_ROOT / f"{epub_name}_translated")
+        self._title_generation += 1
+
+        if titles is not None:
+            self.chapter_statuses = {i: ChapterStatus(i, title) for i, title in enumerate(titles, 1)}
+        else:
+            # Show the table immediately with placeholder titles, then fill
+            # titles in as the pool extracts them
+            self.chapter_statuses = {i: ChapterStatus(i, "") for i in range(1, len(chapters) + 1)}
 
         self.status_label.setText(f"EPUB: {epub_name}")
-        self.chapter_count_label.setText(f"Total Chapters: {len(chapters)}")
+        self.chapter_count_label.setText(f"Total Chapters: {len(self.chapter_statuses)}")
         self.refresh_status()
 
+        if titles is not None:
+            self._titles_pending = 0
+            return
+
+        self._titles_pending = len(chapters)
+        pool = QThreadPool.globalInstance()
+        for i in range(1, len(chapters) + 1):
+            pool.start(TitleExtractJob(self._title_generation, i, chapters, self._title_signals))
+
+    def _on_title_ready(self, generation: int, chapter_num: int, title: str):
+        """Patch a single title cell once its extraction job finishes."""
+        if generation != self._title_generation:
+            return
+        status = self.chapter_statuses.get(chapter_num)
+        if title and status is not None:
+            status.title = title
+            # Rows follow chapter order (see update_table)
+            item = self.chapter_table.item(chapter_num - 1, 1)
+            if item is not None:
+                item.setText(title)
+
+        self._titles_pending -= 1
+        if self._titles_pending == 0:
+            save_manifest(self.epub_path, [s.title for s in self.chapter_statuses.values()])
+
     def refresh_status(self):
         """Refresh the status of all chapters."""
         if not hasattr(self, 'output_folder'):
             return
 
-        # Update status for each chapter
+        # Update status for each chapter; only existing files need a stat
+        xhtml_dir = os.path.join(self.output_folder, "xhtml")
+        existing = translated_chapter_numbers(xhtml_dir)
         for chapter_num, status in self.chapter_statuses.items():
-            xhtml_path = os.path.join(self.output_folder, "xhtml", f"{chapter_num}.xhtml")
-            status.update_status(xhtml_path)
+            xhtml_path = os.path.join(xhtml_dir, f"{chapter_num}.xhtml")
+            status.update_status(xhtml_path, exists=chapter_num in existing)
 
         self.update_table()
         self.update_summary()
@@ -1,34 +1,193 @@
 """Main application window for the EPUB translator."""
 
+import contextlib
 import os
+from collections import deque
 import sys
-import json
+import gzip
 import logging
-import queue
+import re
 import threading
 import time
-import traceback
-from PySide6.QtCore import Qt
+from PySide6.QtCore import (Qt, QTimer, QObject, QRunnable, QThreadPool, QSignalBlocker,
+                            QByteArray, QItemSelectionModel, QStringListModel, Signal)
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QLabel, QLineEdit, QPushButton,
                              QFileDialog, QCheckBox, QSpinBox, QVBoxLayout, QHBoxLayout,
-                             QRadioButton, QTabWidget, QTextEdit, QScrollArea, QGroupBox,
-                             QDoubleSpinBox, QComboBox, QListWidget, QListWidgetItem,
-                             QAbstractItemView, QMessageBox, QMenuBar, QSplitter)
-from PySide6.QtGui import QFont, QAction, QTextCursor
+                             QRadioButton, QTabWidget, QPlainTextEdit, QScrollArea, QGroupBox,
+                             QDoubleSpinBox, QComboBox, QListWidget, QListWidgetItem, QListView,
+                             QAbstractItemView, QMessageBox, QMenuBar, QSplitter, QFormLayout,
+                             QPlainTextDocumentLayout)
+from PySide6.QtGui import QFont, QAction, QTextCharFormat, QTextCursor, QTextDocument
 from ebooklib import epub
 
 from ..config import ConfigManager
 from ..providers import PROVIDERS
 from ..api import OpenRouterFetcher, ModelFetcher
-from ..core import TranslationWorker
+from ..core import (AtomicChapterIter, ContextManager, EpubRebuilder, LazyChapterList,
+                    TranslationWorker, translated_chapter_numbers)
+from ..core.context_manager import format_character_name
+from ..core.toc_translation_worker import TocTranslationWorker
+from ..utils import json_io
+from ..utils.epub_manifest import load_manifest
+from ..utils.paths import PROJECT_ROOT
 from .chapter_overview_widget import ChapterOverviewWidget
 
 logger = logging.getLogger(__name__)
 
+# How often worker progress rings are drained, and how many messages each
+# worker may contribute per tick
+PROGRESS_DRAIN_INTERVAL_MS = 30
+PROGRESS_ITEMS_PER_TICK = 64
+
+# Bursts of setting toggles within this window trigger one update_controls
+CONTROLS_UPDATE_DELAY_MS = 50
+
+# Background EPUB loads only show a busy indicator if they take longer than this
+EPUB_LOAD_INDICATOR_DELAY_MS = 200
+# Settings edits are written to disk once they have been quiet this long
+CONFIG_SAVE_DELAY_MS = 1500
+# Lines kept by the worker/TOC logs and the raw JSON tab; older lines are
+# dropped so a long run cannot grow the documents without bound
+LOG_MAX_BLOCKS = 1000
+RAW_JSON_MAX_BLOCKS = 5000
+# Responses queued for an unopened raw JSON tab; older ones are dropped
+RAW_JSON_MAX_PENDING = 100
+# Context-file notifications from workers are collapsed into one refresh
+DISPLAY_REFRESH_DELAY_MS = 100
+# Responses arriving while the raw JSON tab is shown are appended, and the
+# view scrolled, at most this often
+RAW_JSON_FLUSH_DELAY_MS = 100
+# Context files at least this large are parsed on the thread pool
+BACKGROUND_PARSE_MIN_BYTES = 1_000_000
+
+# One entry of the CSV chapter list: "12" or "12-20"
+_CSV_RANGE_RE = re.compile(r'(\d+)(?:\s*-\s*(\d+))?')
+
+
+def _parse_epub(epub_path):
+    """Read an EPUB and collect its HTML documents. Safe to run off the GUI thread.
+
+    Returns (book, html_items, chapters); chapters is a LazyChapterList, so
+    chapter text is only decoded when it is read. html_items is kept so the
+    TOC map can be built without filtering the manifest again.
+    """
+    book = epub.read_epub(epub_path)
+    html_items = [item for item in book.get_items() if isinstance(item, epub.EpubHtml)]
+    return book, html_items, LazyChapterList(html_items)
+
+
+class _EpubLoadSignals(QObject):
+    """Signal carrier for _EpubLoadJob (QRunnable can't declare signals)."""
+
+    loaded = Signal(str, object, object, object, object)  # epub_path, book, html_items, chapters, titles
+    failed = Signal(str, str)  # epub_path, error message
+
+
+class _EpubLoadJob(QRunnable):
+    """Parses an EPUB on a QThreadPool thread.
+
+    Titles from the cached manifest are passed through when they still match
+    the chapter count; otherwise titles is None and the chapter overview
+    extracts them progressively.
+    """
+
+    def __init__(self, epub_path, signals, titles=None):
+        super().__init__()
+        self.epub_path = epub_path
+        self.signals = signals
+        self.titles = titles
+
+    def run(self):
+        try:
+            book, html_items, chapters = _parse_epub(self.epub_path)
+        except Exception as e:
+            self.signals.failed.emit(self.epub_path, str(e))
+            return
+        titles = self.titles
+        if titles is not None and len(titles) != len(chapters):
+            titles = None
+        self.signals.loaded.emit(self.epub_path, book, html_items, chapters, titles)
+
+
+class _ContextLoadSignals(QObject):
+    """Signal carrier for _ContextLoadJob."""
+
+    # path, file stamp, parsed dict or the exception parsing raised
+    loaded = Signal(str, object, object)
+
+
+class _ContextLoadJob(QRunnable):
+    """Parses a large context file on a QThreadPool thread."""
+
+    def __init__(self, path, file_stamp, signals):
+        super().__init__()
+        self.path = path
+        self.file_stamp = file_stamp
+        self.signals = signals
+
+    def run(self):
+        try:
+            data = dict(json_io.iter_object_items(self.path))
+        except Exception as e:
+            data = e
+        self.signals.loaded.emit(self.path, self.file_stamp, data)
+
+
+class _EpubWriteSignals(QObject):
+    """Signal carrier for _EpubWriteTask."""
+
+    written = Signal(bool, str)  # success, output path or error message
+
+
+class _EpubWriteTask(QRunnable):
+    """Writes a rebuilt EPUB on a QThreadPool thread."""
+
+    def __init__(self, rebuilder, path, signals):
+        super().__init__()
+        self.rebuilder = rebuilder
+        self.path = path
+        self.signals = signals
+
+    def run(self):
+        try:
+            self.rebuilder.write_epub(self.path)
+        except Exception as e:
+            logger.error(f"Error writing EPUB: {e}", exc_info=True)
+            self.signals.written.emit(False, str(e))
+            return
+        self.signals.written.emit(True, self.path)
+
+
+class _ProviderListItem(QListWidgetItem):
+    """Available-provider row whose tooltip is formatted only when shown."""
+
+    def __init__(self, detail):
+        super().__init__(f"{detail['provider_id']} | "
+                         f"{detail['pricing']} | "
+                         f"ctx:{detail['context_length']} | "
+                         f"{detail['quantization']} | "
+                         f"uptime:{detail['uptime']}")
+        self.detail = detail
+        self.setData(Qt.UserRole, detail['provider_id'])
+
+    def data(self, role):
+        if role == Qt.ToolTipRole:
+            detail = self.detail
+            return (f"Provider: {detail['provider_name']}\n"
+                    f"ID: {detail['provider_id']}\n"
+                    f"Pricing: {detail['pricing']}\n"
+                    f"Context Length: {detail['context_length']}\n"
+                    f"Quantization: {detail['quantization']}\n"
+                    f"Uptime (30m): {detail['uptime']}")
+        return super().data(role)
+
 
 class EpubTranslatorApp(QMainWindow):
     """Main application window."""
 
+    # Emitted once per burst of user edits to the settings that drive update_controls
+    config_changed = Signal()
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Advanced EPUB Translator")
@@ -38,42 +197,117 @@ class EpubTranslatorApp(QMainWindow):
         self.config_manager = ConfigManager()
         self.config = self.config_manager.load_config()
 
-        # Set window geometry from config
-        geometry = self.config.get('window_geometry', {})
-        self.setGeometry(
-            geometry.get('x', 100),
-            geometry.get('y', 100),
-            geometry.get('width', 1400),
-            geometry.get('height', 1000)
-        )
+        # Set window geometry from config; older configs only have the x/y/size dict
+        geometry_b64 = self.config.get('window_geometry_b64', '')
+        if not (geometry_b64 and self.restoreGeometry(QByteArray.fromBase64(geometry_b64.encode('ascii')))):
+            geometry = self.config.get('window_geometry', {})
+            self.setGeometry(
+                geometry.get('x', 100),
+                geometry.get('y', 100),
+                geometry.get('width', 1400),
+                geometry.get('height', 1000)
+            )
 
         self.workers = {}
+        self._stopping_workers = {}  # stopped but still finishing a request
         self.worker_count = 0
         self.chapters = []
         self.epub_book = None
         self.epub_path = None
+        self._html_items = []  # EpubHtml items of epub_book, in chapter order
+        # Output locations for the loaded EPUB, set by _on_epub_loaded
+        self.epub_name = ""
+        self.output_folder = ""
+        self.context_folder = ""
+        self._created_output_folders = set()
         self.toc_translations = {}  # {chapter_number: [{"original": ..., "translated": ...}]}
 
         # OpenRouter data
         self.available_models = []
         self.current_providers = []
         self.current_provider_details = []
+        # Ids in the selected-providers model, for O(1) duplicate checks
+        self._selected_provider_ids = set()
         self.fetcher_thread = None
 
+        # Drains worker progress rings into the log tabs on the GUI thread
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(PROGRESS_DRAIN_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._drain_worker_progress)
+
+        # Coalesces settings toggles into a single update_controls/config_changed
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(CONTROLS_UPDATE_DELAY_MS)
+        self._update_timer.timeout.connect(self._do_update_controls)
+
+        # Debounced settings autosave; the serialized form of the last write
+        # lets unchanged configs skip the disk (and .env) entirely
+        self._saved_config_bytes = None
+        self._config_save_timer = QTimer(self)
+        self._config_save_timer.setSingleShot(True)
+        self._config_save_timer.setInterval(CONFIG_SAVE_DELAY_MS)
+        self._config_save_timer.timeout.connect(self._persist_config)
+
         # File tracking
         self.current_character_file = ""
         self.current_place_file = ""
         self.current_terms_file = ""
         self.current_notes_file = ""
         self.current_toc_file = ""
+        self._context_paths_name = None  # epub_name the paths above were built for
+        # Per display tab: (widget, path, file stamp) it was last rendered from
+        self._display_stamps = {}
+        # Parsed context files: path -> (file stamp, data)
+        self._display_cache = {}
+        # Context files being parsed on the pool
+        self._context_loads_pending = set()
+        self._batch_ui_depth = 0
+        # Page of the current TOC translation tab and the title it shows
+        self._toc_tab_page = None
+        self._toc_tab_title = None
+        self._display_refresh_timer = QTimer(self)
+        self._display_refresh_timer.setSingleShot(True)
+        self._display_refresh_timer.setInterval(DISPLAY_REFRESH_DELAY_MS)
+        self._display_refresh_timer.timeout.connect(self.update_all_displays)
+
+        # Compressed raw responses not yet shown; decompressed when the tab is viewed
+        self._pending_raw_json = deque(maxlen=RAW_JSON_MAX_PENDING)
+        self._raw_json_flush_timer = QTimer(self)
+        self._raw_json_flush_timer.setSingleShot(True)
+        self._raw_json_flush_timer.setInterval(RAW_JSON_FLUSH_DELAY_MS)
+        self._raw_json_flush_timer.timeout.connect(self._flush_raw_json_display)
+
+        # Background EPUB loading; results for any other path are stale
+        self._pending_epub_path = None
+        self._epub_load_signals = _EpubLoadSignals(self)
+        self._epub_load_signals.loaded.connect(self._on_epub_load_finished)
+        self._epub_load_signals.failed.connect(self._on_epub_load_failed)
+        self._context_load_signals = _ContextLoadSignals(self)
+        self._context_load_signals.loaded.connect(self._on_context_loaded)
+        self._epub_write_signals = _EpubWriteSignals(self)
+        self._epub_write_signals.written.connect(self._on_toc_epub_written)
+
+        # Right-hand tab panel; built just after the window first paints
+        self.tabs = None
+        self._tabs_pending_calls = []
 
         self.init_ui()
         self.load_config_to_ui()
+        self._connect_config_autosave()
+
+    # Fonts shared by every widget that uses them; built once in init_ui
+    # (QFont needs a running QApplication)
+    _MONO_FONT = None
+    _RAW_FONT = None
+    _LOG_FONT = None
 
     def init_ui(self):
         """Initialize the UI."""
-        # Create menu bar
-        self.create_menu_bar()
+        if EpubTranslatorApp._MONO_FONT is None:
+            EpubTranslatorApp._MONO_FONT = QFont("Consolas", 10)
+            EpubTranslatorApp._RAW_FONT = QFont("Courier New", 9)
+            EpubTranslatorApp._LOG_FONT = QFont("Consolas", 9)
 
         # Central widget with splitter
         central_widget = QWidget()
@@ -83,21 +317,41 @@ class EpubTranslatorApp(QMainWindow):
         central_widget.setLayout(main_layout)
 
         # Create main splitter (horizontal)
-        main_splitter = QSplitter(Qt.Horizontal)
-        main_layout.addWidget(main_splitter)
+        self._main_splitter = QSplitter(Qt.Horizontal)
+        main_layout.addWidget(self._main_splitter)
 
         # Left panel for settings
         left_panel = QWidget()
         left_panel.setMinimumWidth(300)
         self.setup_settings_panel(left_panel)
-        main_splitter.addWidget(left_panel)
+        self._main_splitter.addWidget(left_panel)
+        self._main_splitter.setChildrenCollapsible(True)
+
+        # The menu bar and the tab panel are built on the first event-loop
+        # pass so the window can paint before them
+        QTimer.singleShot(0, self._build_tabs_and_menu)
+
+    def _build_tabs_and_menu(self):
+        """Deferred second half of init_ui."""
+        self.create_menu_bar()
 
         # Right panel with tabs
-        self.setup_tabs_panel(main_splitter)
+        self.setup_tabs_panel(self._main_splitter)
 
         # Set splitter proportions
-        main_splitter.setSizes([350, 1050])
-        main_splitter.setChildrenCollapsible(True)
+        self._main_splitter.setSizes([350, 1050])
+
+        # Apply EPUB updates that arrived before the panel existed
+        pending, self._tabs_pending_calls = self._tabs_pending_calls, []
+        for func, args in pending:
+            func(*args)
+
+    def _call_with_tabs(self, func, *args):
+        """Call func now, or once _build_tabs_and_menu has built the tab panel."""
+        if self.tabs is None:
+            self._tabs_pending_calls.append((func, args))
+        else:
+            func(*args)
 
     def create_menu_bar(self):
         """Create the menu bar."""
@@ -353,7 +607,11 @@ class EpubTranslatorApp(QMainWindow):
         self.remove_provider_btn.clicked.connect(self.remove_provider)
         provider_buttons.addWidget(self.remove_provider_btn)
 
-        self.selected_providers_list = QListWidget()
+        # Selected providers are plain ids, so a string model is enough
+        self._selected_providers_model = QStringListModel(self)
+        self.selected_providers_list = QListView()
+        self.selected_providers_list.setModel(self._selected_providers_model)
+        self.selected_providers_list.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.selected_providers_list.setMaximumHeight(100)
 
         self.move_up_btn = QPushButton("↑")
@@ -366,7 +624,7 @@ class EpubTranslatorApp(QMainWindow):
         self.move_down_btn.clicked.connect(self.move_provider_down)
         provider_buttons.addWidget(self.move_down_btn)
 
-        self.selected_providers_list.itemSelectionChanged.connect(self.update_provider_buttons)
+        self.selected_providers_list.selectionModel().selectionChanged.connect(self.update_provider_buttons)
         self.update_provider_buttons()
 
         provider_row.addWidget(self.available_providers_list)
@@ -429,103 +687,73 @@ class EpubTranslatorApp(QMainWindow):
         # Connect signals
         self.range_radio.toggled.connect(self.toggle_chapter_selection)
         self.csv_radio.toggled.connect(self.toggle_chapter_selection)
+        self.range_radio.toggled.connect(self._schedule_update_controls)
+        self.csv_radio.toggled.connect(self._schedule_update_controls)
 
     def _add_translation_settings(self, layout):
         """Add translation settings section."""
         settings_group = QGroupBox("Translation Settings")
         settings_layout = QVBoxLayout()
 
-        # Parameters row 1
-        params_row1 = QHBoxLayout()
-        params_row1.addWidget(QLabel("Chunk Tokens:"))
+        # Label/field parameter rows; the first four rows carry a second
+        # field inline
+        params_form = QFormLayout()
+        params_form.setFieldGrowthPolicy(QFormLayout.FieldsStayAtSizeHint)
+
         self.max_tokens_entry = QLineEdit()
         self.max_tokens_entry.setMaximumWidth(80)
-        params_row1.addWidget(self.max_tokens_entry)
-
-        params_row1.addWidget(QLabel("Workers:"))
         self.concurrency_spin = QSpinBox()
         self.concurrency_spin.setRange(1, 10)
         self.concurrency_spin.setMaximumWidth(60)
-        params_row1.addWidget(self.concurrency_spin)
-        params_row1.addStretch()
-
-        settings_layout.addLayout(params_row1)
+        params_form.addRow("Chunk Tokens:", self._inline_pair(
+            self.max_tokens_entry, "Workers:", self.concurrency_spin))
 
-        # Parameters row 2
-        params_row2 = QHBoxLayout()
-        params_row2.addWidget(QLabel("Temperature:"))
         self.temperature_spin = QDoubleSpinBox()
         self.temperature_spin.setRange(0.0, 2.0)
         self.temperature_spin.setSingleStep(0.05)
         self.temperature_spin.setDecimals(2)
         self.temperature_spin.setMaximumWidth(80)
-        params_row2.addWidget(self.temperature_spin)
-
-        params_row2.addWidget(QLabel("Max Tokens:"))
         self.max_tokens_spin = QSpinBox()
         self.max_tokens_spin.setRange(100, 1000000)
         self.max_tokens_spin.setMaximumWidth(110)
-        params_row2.addWidget(self.max_tokens_spin)
-        params_row2.addStretch()
-
-        settings_layout.addLayout(params_row2)
+        params_form.addRow("Temperature:", self._inline_pair(
+            self.temperature_spin, "Max Tokens:", self.max_tokens_spin))
 
-        # Parameters row 3
-        params_row3 = QHBoxLayout()
-        params_row3.addWidget(QLabel("Frequency Penalty:"))
         self.frequency_penalty_spin = QDoubleSpinBox()
         self.frequency_penalty_spin.setRange(-2.0, 2.0)
         self.frequency_penalty_spin.setSingleStep(0.01)
         self.frequency_penalty_spin.setDecimals(2)
         self.frequency_penalty_spin.setMaximumWidth(80)
-        params_row3.addWidget(self.frequency_penalty_spin)
-        params_row3.addWidget(QLabel("Top P:"))
         self.top_p_spin = QDoubleSpinBox()
         self.top_p_spin.setRange(0.0, 1.0)
         self.top_p_spin.setSingleStep(0.01)
         self.top_p_spin.setDecimals(2)
         self.top_p_spin.setMaximumWidth(80)
-        params_row3.addWidget(self.top_p_spin)
-        params_row3.addStretch()
+        params_form.addRow("Frequency Penalty:", self._inline_pair(
+            self.frequency_penalty_spin, "Top P:", self.top_p_spin))
 
-        settings_layout.addLayout(params_row3)
-
-        # Parameters row 4 - Top K and Retries per provider
-        params_row4 = QHBoxLayout()
-        params_row4.addWidget(QLabel("Top K:"))
+        # Top K and Retries per provider
         self.top_k_spin = QSpinBox()
         self.top_k_spin.setRange(0, 100)
         self.top_k_spin.setMaximumWidth(80)
         self.top_k_spin.setToolTip("Top K sampling (0 = disabled, provider-dependent)")
-        params_row4.addWidget(self.top_k_spin)
-
-        params_row4.addWidget(QLabel("Retries per Provider:"))
         self.retries_per_provider_spin = QSpinBox()
         self.retries_per_provider_spin.setRange(1, 10)
         self.retries_per_provider_spin.setMaximumWidth(60)
         self.retries_per_provider_spin.setToolTip("Number of retry attempts for each provider before moving to the next")
-        params_row4.addWidget(self.retries_per_provider_spin)
-        params_row4.addStretch()
+        params_form.addRow("Top K:", self._inline_pair(
+            self.top_k_spin, "Retries per Provider:", self.retries_per_provider_spin))
 
-        settings_layout.addLayout(params_row4)
-
-        # Parameters row 5 - Timeout
-        params_row5 = QHBoxLayout()
-        params_row5.addWidget(QLabel("Timeout (seconds):"))
+        # Timeout
         self.timeout_spin = QDoubleSpinBox()
         self.timeout_spin.setRange(1.0, 600.0)
         self.timeout_spin.setSingleStep(5.0)
         self.timeout_spin.setDecimals(1)
         self.timeout_spin.setMaximumWidth(80)
         self.timeout_spin.setToolTip("API request timeout in seconds")
-        params_row5.addWidget(self.timeout_spin)
-        params_row5.addStretch()
-
-        settings_layout.addLayout(params_row5)
+        params_form.addRow("Timeout (seconds):", self.timeout_spin)
 
-        # Parameters row 6 - JSON output mode
-        params_row6 = QHBoxLayout()
-        params_row6.addWidget(QLabel("JSON output:"))
+        # JSON output mode
         self.json_output_combo = QComboBox()
         self.json_output_combo.addItem("Off", "off")
         self.json_output_combo.addItem("JSON Object", "json_object")
@@ -536,10 +764,9 @@ class EpubTranslatorApp(QMainWindow):
             "JSON Schema: strict structured outputs (OpenRouter only — falls back to "
             "JSON Object on DeepSeek/Custom)"
         )
-        params_row6.addWidget(self.json_output_combo)
-        params_row6.addStretch()
+        params_form.addRow("JSON output:", self.json_output_combo)
 
-        settings_layout.addLayout(params_row6)
+        settings_layout.addLayout(params_form)
 
         # Reasoning group
         self.reasoning_group = QGroupBox("Reasoning / Thinking")
@@ -602,9 +829,10 @@ class EpubTranslatorApp(QMainWindow):
         settings_layout.addWidget(self.send_previous_check)
         settings_layout.addWidget(self.send_previous_chunks_check)
 
+        context_form = QFormLayout()
+        context_form.setFieldGrowthPolicy(QFormLayout.FieldsStayAtSizeHint)
+
         # Base prompt position
-        base_prompt_layout = QHBoxLayout()
-        base_prompt_layout.addWidget(QLabel("Base Prompt:"))
         self.base_prompt_combo = QComboBox()
         self.base_prompt_combo.addItem("Off", "off")
         self.base_prompt_combo.addItem("Before Raw (Top)", "top")
@@ -614,24 +842,16 @@ class EpubTranslatorApp(QMainWindow):
             "Before Raw: Send base instruction after context, before the raw text\n"
             "After Raw: Send base instruction after the raw text (default)"
         )
-        base_prompt_layout.addWidget(self.base_prompt_combo)
-        base_prompt_layout.addStretch()
-        settings_layout.addLayout(base_prompt_layout)
+        context_form.addRow("Base Prompt:", self.base_prompt_combo)
 
         # Previous chapters count
-        prev_layout = QHBoxLayout()
-        prev_layout.addWidget(QLabel("Previous Chapters Count:"))
         self.previous_chapters_spin = QSpinBox()
         self.previous_chapters_spin.setRange(0, 10)
         self.previous_chapters_spin.setMaximumWidth(60)
         self.previous_chapters_spin.setEnabled(False)
-        prev_layout.addWidget(self.previous_chapters_spin)
-        prev_layout.addStretch()
-        settings_layout.addLayout(prev_layout)
+        context_form.addRow("Previous Chapters Count:", self.previous_chapters_spin)
 
         # Previous TOC items count
-        prev_toc_layout = QHBoxLayout()
-        prev_toc_layout.addWidget(QLabel("Previous TOC Items:"))
         self.previous_toc_spin = QSpinBox()
         self.previous_toc_spin.setRange(0, 50)
         self.previous_toc_spin.setValue(10)
@@ -640,17 +860,27 @@ class EpubTranslatorApp(QMainWindow):
             "Number of previously translated TOC entries to send for naming consistency.\n"
             "Set to 0 to disable. TOC entries are translated inline with chapter translation."
         )
-        prev_toc_layout.addWidget(self.previous_toc_spin)
-        prev_toc_layout.addStretch()
-        settings_layout.addLayout(prev_toc_layout)
+        context_form.addRow("Previous TOC Items:", self.previous_toc_spin)
+
+        settings_layout.addLayout(context_form)
 
         settings_group.setLayout(settings_layout)
         layout.addWidget(settings_group)
 
         # Connect signals
-        self.send_previous_check.toggled.connect(self.update_controls)
-        self.context_mode_check.toggled.connect(self.update_controls)
-        self.notes_mode_check.toggled.connect(self.update_controls)
+        self.send_previous_check.toggled.connect(self._schedule_update_controls)
+        self.context_mode_check.toggled.connect(self._schedule_update_controls)
+        self.notes_mode_check.toggled.connect(self._schedule_update_controls)
+
+    @staticmethod
+    def _inline_pair(first, label, second):
+        """Field layout holding two widgets on one form row."""
+        row = QHBoxLayout()
+        row.addWidget(first)
+        row.addWidget(QLabel(label))
+        row.addWidget(second)
+        row.addStretch()
+        return row
 
     def _add_embedding_settings(self, layout):
         """Add context filtering settings section."""
@@ -721,43 +951,134 @@ class EpubTranslatorApp(QMainWindow):
         self.chapter_overview = ChapterOverviewWidget(self)
         self.tabs.addTab(self.chapter_overview, "📊 Chapter Overview")
 
-        # Create display tabs
-        self.character_tab = QTextEdit()
-        self.character_tab.setReadOnly(True)
-        self.character_tab.setFont(QFont("Consolas", 10))
-        self.place_tab = QTextEdit()
-        self.place_tab.setReadOnly(True)
-        self.place_tab.setFont(QFont("Consolas", 10))
-        self.terms_tab = QTextEdit()
-        self.terms_tab.setReadOnly(True)
-        self.terms_tab.setFont(QFont("Consolas", 10))
-        self.notes_tab = QTextEdit()
-        self.notes_tab.setReadOnly(True)
-        self.notes_tab.setFont(QFont("Consolas", 10))
-
-        # Add raw JSON display tab
-        self.raw_json_tab = QTextEdit()
-        self.raw_json_tab.setReadOnly(True)
-        self.raw_json_tab.setFont(QFont("Courier New", 9))
+        # Create display tabs. Only TOC is built up front (the TOC worker
+        # streams into it); the rest start as placeholders and get their
+        # QPlainTextEdit the first time they are shown
+        self.character_tab = None
+        self.place_tab = None
+        self.terms_tab = None
+        self.notes_tab = None
+        self.raw_json_tab = None
+        self._tab_placeholders = {}
 
         # Add TOC display tab
-        self.toc_tab = QTextEdit()
+        self.toc_tab = QPlainTextEdit()
         self.toc_tab.setReadOnly(True)
-        self.toc_tab.setFont(QFont("Consolas", 10))
+        self.toc_tab.setFont(self._MONO_FONT)
 
-        self.tabs.addTab(self.character_tab, "👤 Characters")
-        self.tabs.addTab(self.place_tab, "🌍 Places")
-        self.tabs.addTab(self.terms_tab, "⚡ Terms")
-        self.tabs.addTab(self.notes_tab, "📝 Notes")
+        self._add_lazy_tab('character_tab', "👤 Characters")
+        self._add_lazy_tab('place_tab', "🌍 Places")
+        self._add_lazy_tab('terms_tab', "⚡ Terms")
+        self._add_lazy_tab('notes_tab', "📝 Notes")
         self.tabs.addTab(self.toc_tab, "📑 TOC")
-        self.tabs.addTab(self.raw_json_tab, "🔧 Raw JSON")
+        self._add_lazy_tab('raw_json_tab', "🔧 Raw JSON")
+
+        # Connected last: adding the first tab emits currentChanged
+        self.tabs.currentChanged.connect(self.on_tab_changed)
+
+    # Lazily built display tabs: attribute -> (font attribute, renderer,
+    # maximum block count, 0 for unlimited)
+    _LAZY_TABS = {
+        'character_tab': ('_MONO_FONT', 'update_character_display', 0),
+        'place_tab': ('_MONO_FONT', 'update_place_display', 0),
+        'terms_tab': ('_MONO_FONT', 'update_terms_display', 0),
+        'notes_tab': ('_MONO_FONT', 'update_notes_display', 0),
+        'raw_json_tab': ('_RAW_FONT', '_flush_raw_json_display', RAW_JSON_MAX_BLOCKS),
+    }
+
+    def _add_lazy_tab(self, attr, title):
+        """Add a placeholder tab whose real widget is built on first view."""
+        placeholder = QWidget()
+        self._tab_placeholders[placeholder] = attr
+        self.tabs.addTab(placeholder, title)
+
+    def _build_lazy_tab(self, index, placeholder, attr):
+        """Swap a placeholder for its QPlainTextEdit and render its content."""
+        font_attr, renderer, max_blocks = self._LAZY_TABS[attr]
+        widget = QPlainTextEdit()
+        widget.setReadOnly(True)
+        widget.setFont(getattr(self, font_attr))
+        widget.setMaximumBlockCount(max_blocks)
+        setattr(self, attr, widget)
+
+        title = self.tabs.tabText(index)
+        with QSignalBlocker(self.tabs):
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, widget, title)
+            self.tabs.setCurrentIndex(index)
+        placeholder.deleteLater()
+
+        getattr(self, renderer)()
 
     # ==================== Configuration Methods ====================
 
     def load_config_to_ui(self):
         """Load configuration values to UI components."""
+        # Repaint once after every widget is set, not once per setter, and
+        # keep the toggled/textChanged handlers quiet until the end; each is
+        # run once below instead of once per setter
+        watched = [*self.provider_radios.values(), self.model_combo,
+                   self.range_radio, self.csv_radio,
+                   self.send_previous_check, self.context_mode_check, self.notes_mode_check,
+                   self.context_filter_enabled_check]
+        self.setUpdatesEnabled(False)
+        blockers = [QSignalBlocker(widget) for widget in watched]
+        try:
+            self._apply_config_to_ui()
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+            self.setUpdatesEnabled(True)
+
+        # Sync containers and dependent enable states with the loaded values
+        self.on_endpoint_type_changed()
+        self.on_model_changed(self.model_combo.currentText())
+        self.toggle_chapter_selection()
+        self._update_filter_checkboxes(self.context_filter_enabled_check.isChecked())
+        self.update_controls()
+
+    # Plain value widgets: (config key, widget attribute, getter, setter, default)
+    _FIELDS = (
+        # Model parameters
+        ('temperature', 'temperature_spin', 'value', 'setValue', 0.55),
+        ('max_tokens', 'max_tokens_spin', 'value', 'setValue', 8000),
+        ('frequency_penalty', 'frequency_penalty_spin', 'value', 'setValue', 0.0),
+        ('top_p', 'top_p_spin', 'value', 'setValue', 1.0),
+        ('top_k', 'top_k_spin', 'value', 'setValue', 0),
+        ('timeout', 'timeout_spin', 'value', 'setValue', 60.0),
+        ('retries_per_provider', 'retries_per_provider_spin', 'value', 'setValue', 1),
+        # Context options
+        ('context_mode', 'context_mode_check', 'isChecked', 'setChecked', False),
+        ('notes_mode', 'notes_mode_check', 'isChecked', 'setChecked', False),
+        ('power_steering', 'power_steering_check', 'isChecked', 'setChecked', False),
+        ('send_previous', 'send_previous_check', 'isChecked', 'setChecked', False),
+        ('previous_chapters', 'previous_chapters_spin', 'value', 'setValue', 1),
+        ('send_previous_chunks', 'send_previous_chunks_check', 'isChecked', 'setChecked', True),
+        ('previous_toc_count', 'previous_toc_spin', 'value', 'setValue', 10),
+        # Concurrency
+        ('concurrent_workers', 'concurrency_spin', 'value', 'setValue', 3),
+        # Chapter selection
+        ('start_chapter', 'start_chapter_entry', 'text', 'setText', '1'),
+        ('end_chapter', 'end_chapter_entry', 'text', 'setText', '1'),
+        ('csv_chapters', 'csv_entry', 'text', 'setText', ''),
+        # Last EPUB path
+        ('last_epub_path', 'epub_path_entry', 'text', 'setText', ''),
+        # Context filtering settings
+        ('context_filter_enabled', 'context_filter_enabled_check', 'isChecked', 'setChecked', False),
+        ('context_filter_characters', 'filter_characters_check', 'isChecked', 'setChecked', False),
+        ('context_filter_places', 'filter_places_check', 'isChecked', 'setChecked', True),
+        ('context_filter_terms', 'filter_terms_check', 'isChecked', 'setChecked', True),
+        # Reasoning
+        ('reasoning_enabled', 'reasoning_enabled_check', 'isChecked', 'setChecked', False),
+        ('reasoning_max_tokens', 'reasoning_max_tokens_spin', 'value', 'setValue', 0),
+        ('reasoning_exclude', 'reasoning_exclude_check', 'isChecked', 'setChecked', False),
+    )
+
+    def _apply_config_to_ui(self):
+        """Push self.config into the widgets (see load_config_to_ui)."""
+        g = self.config.get
         # Endpoint type
-        endpoint_type = self.config.get('endpoint_type', 'openrouter')
+        endpoint_type = g('endpoint_type', 'openrouter')
         radio = self.provider_radios.get(endpoint_type, self.provider_radios['openrouter'])
         radio.setChecked(True)
 
@@ -765,93 +1086,55 @@ class EpubTranslatorApp(QMainWindow):
         for key, provider in PROVIDERS.items():
             pw = self.provider_widgets[key]
             pw['api_key'].setText(
-                self.config.get(provider.api_key_config_key, '')
+                g(provider.api_key_config_key, '')
             )
             if 'url' in pw:
                 pw['url'].setText(
-                    self.config.get(
+                    g(
                         provider.url_config_key, provider.default_base_url
                     )
                 )
             if 'model' in pw:
                 pw['model'].setCurrentText(
-                    self.config.get(provider.model_config_key, provider.default_model)
+                    g(provider.model_config_key, provider.default_model)
                 )
 
         # OpenRouter model (lives in the separate model browser, not the provider container)
-        self.model_combo.setCurrentText(self.config.get('model', ''))
+        self.model_combo.setCurrentText(g('model', ''))
 
         # Chunk tokens
-        self.max_tokens_entry.setText(str(self.config.get('chunk_tokens', 7000)))
+        self.max_tokens_entry.setText(str(g('chunk_tokens', 7000)))
 
-        # Model parameters
-        self.temperature_spin.setValue(self.config.get('temperature', 0.55))
-        self.max_tokens_spin.setValue(self.config.get('max_tokens', 8000))
-        self.frequency_penalty_spin.setValue(self.config.get('frequency_penalty', 0.0))
-        self.top_p_spin.setValue(self.config.get('top_p', 1.0))
-        self.top_k_spin.setValue(self.config.get('top_k', 0))
-        self.timeout_spin.setValue(self.config.get('timeout', 60.0))
-        self.retries_per_provider_spin.setValue(self.config.get('retries_per_provider', 1))
+        for key, attr, _getter, setter, default in self._FIELDS:
+            getattr(getattr(self, attr), setter)(g(key, default))
 
         # Selected providers
-        self.selected_providers_list.clear()
-        for provider in self.config.get('selected_providers', []):
-            self.selected_providers_list.addItem(provider)
+        self._set_selected_providers(list(g('selected_providers', [])))
 
-        # Context options
-        self.context_mode_check.setChecked(self.config.get('context_mode', False))
-        self.notes_mode_check.setChecked(self.config.get('notes_mode', False))
-        self.power_steering_check.setChecked(self.config.get('power_steering', False))
-        self.send_previous_check.setChecked(self.config.get('send_previous', False))
-        self.previous_chapters_spin.setValue(self.config.get('previous_chapters', 1))
-        self.send_previous_chunks_check.setChecked(self.config.get('send_previous_chunks', True))
-        self.previous_toc_spin.setValue(self.config.get('previous_toc_count', 10))
-        base_prompt_pos = self.config.get('base_prompt_position', 'bottom')
+        base_prompt_pos = g('base_prompt_position', 'bottom')
         index = self.base_prompt_combo.findData(base_prompt_pos)
         if index >= 0:
             self.base_prompt_combo.setCurrentIndex(index)
 
-        # Concurrency
-        self.concurrency_spin.setValue(self.config.get('concurrent_workers', 3))
-
         # Chapter selection
-        if self.config.get('chapter_selection_mode', 'range') == 'csv':
+        if g('chapter_selection_mode', 'range') == 'csv':
             self.csv_radio.setChecked(True)
         else:
             self.range_radio.setChecked(True)
 
-        self.start_chapter_entry.setText(self.config.get('start_chapter', '1'))
-        self.end_chapter_entry.setText(self.config.get('end_chapter', '1'))
-        self.csv_entry.setText(self.config.get('csv_chapters', ''))
-
-        # Last EPUB path
-        self.epub_path_entry.setText(self.config.get('last_epub_path', ''))
-        if self.epub_path_entry.text():
-            self.load_epub_file(self.epub_path_entry.text())
-
-        # Context filtering settings
-        self.context_filter_enabled_check.setChecked(self.config.get('context_filter_enabled', False))
-        self.filter_characters_check.setChecked(self.config.get('context_filter_characters', False))
-        self.filter_places_check.setChecked(self.config.get('context_filter_places', True))
-        self.filter_terms_check.setChecked(self.config.get('context_filter_terms', True))
-        self._update_filter_checkboxes(self.context_filter_enabled_check.isChecked())
-
         # Reasoning + JSON output mode
-        self.reasoning_enabled_check.setChecked(self.config.get('reasoning_enabled', False))
-        effort = self.config.get('reasoning_effort', 'medium')
+        effort = g('reasoning_effort', 'medium')
         if self.reasoning_effort_combo.findText(effort) >= 0:
             self.reasoning_effort_combo.setCurrentText(effort)
-        self.reasoning_max_tokens_spin.setValue(self.config.get('reasoning_max_tokens', 0))
-        self.reasoning_exclude_check.setChecked(self.config.get('reasoning_exclude', False))
 
-        json_mode = self.config.get('json_output_mode', 'off')
+        json_mode = g('json_output_mode', 'off')
         json_index = self.json_output_combo.findData(json_mode)
         if json_index >= 0:
             self.json_output_combo.setCurrentIndex(json_index)
 
-        # Sync containers and reasoning-group enable state with the active endpoint
-        self.on_endpoint_type_changed()
-        self.update_controls()
+        # Last EPUB path
+        if self.epub_path_entry.text():
+            self.load_epub_file(self.epub_path_entry.text())
 
     def get_config_from_ui(self):
         """Extract configuration from current UI state."""
@@ -871,73 +1154,33 @@ class EpubTranslatorApp(QMainWindow):
         config['model'] = self.model_combo.currentText()
 
         # Chunk tokens
-        try:
-            config['chunk_tokens'] = int(self.max_tokens_entry.text())
-        except ValueError:
-            config['chunk_tokens'] = 7000
+        chunk_text = self.max_tokens_entry.text().strip()
+        config['chunk_tokens'] = int(chunk_text) if chunk_text.isdecimal() else 7000
 
-        # Model parameters
-        config['temperature'] = self.temperature_spin.value()
-        config['max_tokens'] = self.max_tokens_spin.value()
-        config['frequency_penalty'] = self.frequency_penalty_spin.value()
-        config['top_p'] = self.top_p_spin.value()
-        config['top_k'] = self.top_k_spin.value()
-        config['timeout'] = self.timeout_spin.value()
-        config['retries_per_provider'] = self.retries_per_provider_spin.value()
+        for key, attr, getter, _setter, _default in self._FIELDS:
+            config[key] = getattr(getattr(self, attr), getter)()
 
         # Selected providers
         config['selected_providers'] = self.get_selected_providers()
 
-        # Context options
-        config['context_mode'] = self.context_mode_check.isChecked()
-        config['notes_mode'] = self.notes_mode_check.isChecked()
-        config['power_steering'] = self.power_steering_check.isChecked()
-        config['send_previous'] = self.send_previous_check.isChecked()
-        config['previous_chapters'] = self.previous_chapters_spin.value()
-        config['send_previous_chunks'] = self.send_previous_chunks_check.isChecked()
-        config['previous_toc_count'] = self.previous_toc_spin.value()
         config['base_prompt_position'] = self.base_prompt_combo.currentData()
-
-        # Concurrency
-        config['concurrent_workers'] = self.concurrency_spin.value()
-
-        # Chapter selection
         config['chapter_selection_mode'] = 'csv' if self.csv_radio.isChecked() else 'range'
-        config['start_chapter'] = self.start_chapter_entry.text()
-        config['end_chapter'] = self.end_chapter_entry.text()
-        config['csv_chapters'] = self.csv_entry.text()
-
-        # Last EPUB path
-        config['last_epub_path'] = self.epub_path_entry.text()
-
-        # Window geometry
-        config['window_geometry'] = {
-            'x': self.x(),
-            'y': self.y(),
-            'width': self.width(),
-            'height': self.height()
-        }
 
-        # Context filtering settings
-        config['context_filter_enabled'] = self.context_filter_enabled_check.isChecked()
-        config['context_filter_characters'] = self.filter_characters_check.isChecked()
-        config['context_filter_places'] = self.filter_places_check.isChecked()
-        config['context_filter_terms'] = self.filter_terms_check.isChecked()
+        # Window geometry (also captures maximized state and screen)
+        config['window_geometry_b64'] = bytes(self.saveGeometry().toBase64()).decode('ascii')
 
         # Reasoning + JSON output mode
-        config['reasoning_enabled'] = self.reasoning_enabled_check.isChecked()
         config['reasoning_effort'] = self.reasoning_effort_combo.currentText()
-        config['reasoning_max_tokens'] = self.reasoning_max_tokens_spin.value()
-        config['reasoning_exclude'] = self.reasoning_exclude_check.isChecked()
         config['json_output_mode'] = self.json_output_combo.currentData() or 'off'
 
         return config
 
     def save_current_config(self):
         """Save current UI state to configuration."""
+        self._config_save_timer.stop()
         self.config = self.get_config_from_ui()
 
-        if self.config_manager.save_config(self.config):
+        if self._write_config(self.config):
             QMessageBox.information(self, "Success", "Configuration saved successfully!")
         else:
             QMessageBox.critical(self, "Error", "Failed to save configuration!")
@@ -950,9 +1193,7 @@ class EpubTranslatorApp(QMainWindow):
 
         if config_path:
             try:
-                import json
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    loaded_config = json.load(f)
+                loaded_config = json_io.load_file(config_path)
 
                 # Merge with current config
                 self.config.update(loaded_config)
@@ -968,20 +1209,17 @@ class EpubTranslatorApp(QMainWindow):
             QMessageBox.warning(self, "Warning", "No EPUB file loaded!")
             return
 
-        epub_path = self.epub_path_entry.text()
+        epub_path = self.epub_path
         if not epub_path:
             QMessageBox.warning(self, "Warning", "No EPUB file selected!")
             return
 
-        epub_name = os.path.splitext(os.path.basename(epub_path))[0]
-        output_folder = os.path.join(os.path.dirname(__file__), "..", "..", "..", f"{epub_name}_translated")
+        epub_name = self.epub_name
+        output_folder = self.output_folder
 
         # Find completed chapters
-        completed_chapters = []
-        if os.path.exists(output_folder):
-            for i in range(1, len(self.chapters) + 1):
-                if os.path.exists(os.path.join(output_folder, "xhtml", f"{i}.xhtml")):
-                    completed_chapters.append(i)
+        existing = translated_chapter_numbers(os.path.join(output_folder, "xhtml"))
+        completed_chapters = sorted(n for n in existing if 1 <= n <= len(self.chapters))
 
         # Get config but strip sensitive keys before saving to session file
         session_config = self.get_config_from_ui()
@@ -1013,67 +1251,131 @@ class EpubTranslatorApp(QMainWindow):
         session_data = self.config_manager.load_last_session()
 
         if not session_data:
-            QMessageBox.information(self, "Info", "No previous session found!")
+            self._show_info("Info", "No previous session found!")
             return
 
         # Ask user if they want to continue
         completed = len(session_data.get('completed_chapters', []))
         total = session_data.get('total_chapters', 0)
 
-        reply = QMessageBox.question(
-            self, "Continue Translation",
+        self._ask_yes_no(
+            "Continue Translation",
             f"Found previous session:\n"
             f"EPUB: {session_data.get('epub_name', 'Unknown')}\n"
             f"Progress: {completed}/{total} chapters completed\n"
             f"Last chapter: {session_data.get('last_completed', 0)}\n\n"
             f"Do you want to continue this translation?",
-            QMessageBox.Yes | QMessageBox.No
+            lambda: self._continue_session(session_data),
         )
 
-        if reply == QMessageBox.Yes:
-            # Load the session
-            epub_path = session_data.get('epub_path', '')
-            if epub_path and os.path.exists(epub_path):
-                self.epub_path_entry.setText(epub_path)
-                self.load_epub_file(epub_path)
+    def _continue_session(self, session_data):
+        """Load a previous session the user chose to continue."""
+        epub_path = session_data.get('epub_path', '')
+        if epub_path and os.path.exists(epub_path):
+            self.epub_path_entry.setText(epub_path)
+            self.load_epub_file(epub_path)
 
-                # Load configuration from session
-                if 'config' in session_data:
-                    self.config.update(session_data['config'])
-                    self.load_config_to_ui()
+            # Load configuration from session
+            if 'config' in session_data:
+                self.config.update(session_data['config'])
+                self.load_config_to_ui()
 
-                # Set up for continuation
-                last_completed = session_data.get('last_completed', 0)
-                self.start_chapter_entry.setText(str(last_completed + 1))
-                self.end_chapter_entry.setText(str(total))
+            # Set up for continuation
+            last_completed = session_data.get('last_completed', 0)
+            self.start_chapter_entry.setText(str(last_completed + 1))
+            self.end_chapter_entry.setText(str(session_data.get('total_chapters', 0)))
 
-                QMessageBox.information(
-                    self, "Session Loaded",
-                    f"Session loaded successfully!\n"
-                    f"Ready to continue from chapter {last_completed + 1}"
-                )
-            else:
-                QMessageBox.critical(self, "Error", "EPUB file from session not found!")
+            self._show_info(
+                "Session Loaded",
+                f"Session loaded successfully!\n"
+                f"Ready to continue from chapter {last_completed + 1}"
+            )
+        else:
+            QMessageBox.critical(self, "Error", "EPUB file from session not found!")
 
     def reset_to_defaults(self):
         """Reset configuration to defaults."""
-        reply = QMessageBox.question(
-            self, "Reset Configuration",
+        self._ask_yes_no(
+            "Reset Configuration",
             "Are you sure you want to reset all settings to defaults?",
-            QMessageBox.Yes | QMessageBox.No
+            self._reset_config,
         )
 
-        if reply == QMessageBox.Yes:
-            self.config = self.config_manager.default_config.copy()
-            self.load_config_to_ui()
-            QMessageBox.information(self, "Success", "Configuration reset to defaults!")
+    def _reset_config(self):
+        """Replace the config with the defaults the user confirmed."""
+        self.config = self.config_manager.default_config.copy()
+        self.load_config_to_ui()
+        self._show_info("Success", "Configuration reset to defaults!")
+
+    def _ask_yes_no(self, title, text, on_yes):
+        """Ask a Yes/No question without blocking; on_yes runs if Yes is clicked.
+
+        The box is opened window-modal with open() rather than exec(), so the
+        event loop (and worker log draining) keeps running while it is up.
+        """
+        box = QMessageBox(QMessageBox.Question, title, text,
+                          QMessageBox.Yes | QMessageBox.No, self)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        yes_button = box.button(QMessageBox.Yes)
+
+        def on_finished(_result):
+            if box.clickedButton() is yes_button:
+                on_yes()
+
+        box.finished.connect(on_finished)
+        box.open()
+
+    def _show_info(self, title, text):
+        """Show an information box without waiting for it to be dismissed."""
+        box = QMessageBox(QMessageBox.Information, title, text, QMessageBox.Ok, self)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.open()
 
     def closeEvent(self, event):
         """Save configuration on close."""
-        self.config = self.get_config_from_ui()
-        self.config_manager.save_config(self.config)
+        # Worker threads are daemons, so a request still in flight doesn't
+        # hold up exit; stopping them just keeps them from starting another
+        for w in self.workers.values():
+            w['worker'].stop()
+
+        # Final write happens here, and only if something changed since the
+        # last one
+        self._config_save_timer.stop()
+        self._persist_config()
         event.accept()
 
+    # Change signal for each _FIELDS getter
+    _FIELD_CHANGE_SIGNALS = {
+        'value': 'valueChanged',
+        'isChecked': 'toggled',
+        'text': 'textChanged',
+    }
+
+    def _connect_config_autosave(self):
+        """Schedule a config save whenever a persisted setting is edited."""
+        for _key, attr, getter, _setter, _default in self._FIELDS:
+            getattr(getattr(self, attr), self._FIELD_CHANGE_SIGNALS[getter]).connect(
+                self._schedule_config_save)
+        self._selected_providers_model.modelReset.connect(self._schedule_config_save)
+        self.config_changed.connect(self._schedule_config_save)
+
+    def _schedule_config_save(self, *_):
+        """(Re)start the save timer so a burst of edits is written once."""
+        self._config_save_timer.start()
+
+    def _persist_config(self):
+        """Write the UI's config if it differs from what was last written."""
+        self.config = self.get_config_from_ui()
+        if json_io.dumps(self.config) != self._saved_config_bytes:
+            self._write_config(self.config)
+
+    def _write_config(self, config):
+        """Save config and remember its serialized form for later diffs."""
+        if not self.config_manager.save_config(config):
+            return False
+        self._saved_config_bytes = json_io.dumps(config)
+        return True
+
     # ==================== UI Interaction Methods ====================
 
     def on_endpoint_type_changed(self):
@@ -1165,21 +1467,35 @@ class EpubTranslatorApp(QMainWindow):
         self.end_chapter_entry.setEnabled(self.range_radio.isChecked())
         self.csv_entry.setEnabled(self.csv_radio.isChecked())
 
+    def _schedule_update_controls(self):
+        """(Re)start the coalescing timer; rapid toggles collapse into one update."""
+        self._update_timer.start()
+
+    def _do_update_controls(self):
+        self.update_controls()
+        self.config_changed.emit()
+
     def update_controls(self):
-        """Update control states based on settings."""
+        """Update control states based on settings.
+
+        Setters only run when the value actually changes, so a toggle that
+        leaves these controls as they are sets off no further signals.
+        """
         # Enable/disable previous chapters spinner
         previous_enabled = self.send_previous_check.isChecked()
-        self.previous_chapters_spin.setEnabled(previous_enabled)
+        if self.previous_chapters_spin.isEnabled() != previous_enabled:
+            self.previous_chapters_spin.setEnabled(previous_enabled)
 
         # Force single worker if any context mode is enabled
         force_single_worker = self.context_mode_check.isChecked() or self.notes_mode_check.isChecked()
+        concurrency_spin = self.concurrency_spin
         if force_single_worker:
-            self.concurrency_spin.setValue(1)
-            self.concurrency_spin.setEnabled(False)
-        else:
-            self.concurrency_spin.setEnabled(True)
-            if self.concurrency_spin.value() == 1:
-                self.concurrency_spin.setValue(3)
+            if concurrency_spin.value() != 1:
+                concurrency_spin.setValue(1)
+        elif concurrency_spin.value() == 1:
+            concurrency_spin.setValue(3)
+        if concurrency_spin.isEnabled() == force_single_worker:
+            concurrency_spin.setEnabled(not force_single_worker)
 
     def on_tab_close_requested(self, index):
         """Handle tab close request."""
@@ -1188,9 +1504,25 @@ class EpubTranslatorApp(QMainWindow):
             return
         widget = self.tabs.widget(index)
         if widget:
+            # Closed display tabs stop receiving updates
+            self._tab_placeholders.pop(widget, None)
+            for attr in self._LAZY_TABS:
+                if getattr(self, attr) is widget:
+                    setattr(self, attr, None)
+            if widget is self._toc_tab_page:
+                self._toc_tab_page = None
             widget.deleteLater()
         self.tabs.removeTab(index)
 
+    def on_tab_changed(self, index):
+        """Render deferred content when its tab becomes visible."""
+        widget = self.tabs.widget(index)
+        attr = self._tab_placeholders.pop(widget, None)
+        if attr is not None:
+            self._build_lazy_tab(index, widget, attr)
+        elif widget is not None and widget is self.raw_json_tab:
+            self._flush_raw_json_display()
+
     # ==================== Provider/Model Methods ====================
 
     def on_model_changed(self, model_text):
@@ -1239,22 +1571,29 @@ class EpubTranslatorApp(QMainWindow):
     def on_models_fetched(self, models):
         """Handle fetched models."""
         self.available_models = models
-        self.model_combo.clear()
-
-        # Sort models by name
-        sorted_models = sorted(models, key=lambda x: x['name'].lower())
-
-        for model in sorted_models:
-            model_display = model['id']
-            self.model_combo.addItem(model_display, model['id'])
 
-        # Try to restore previous selection
-        current_text = self.config.get('model', 'deepseek/deepseek-chat-v3-0324')
-        index = self.model_combo.findData(current_text)
-        if index >= 0:
-            self.model_combo.setCurrentIndex(index)
-        else:
-            self.model_combo.setCurrentText(current_text)
+        # Sort model ids by casefolded name; the key is built once per model
+        # and ties fall back to the id
+        sorted_ids = [model_id for _name, model_id in
+                      sorted((m['name'].casefold(), m['id']) for m in models)]
+
+        # Fill the combo with signals and repaints held off, then report the
+        # final selection once instead of once per inserted model
+        self.model_combo.setUpdatesEnabled(False)
+        with QSignalBlocker(self.model_combo):
+            self.model_combo.clear()
+            for model_id in sorted_ids:
+                self.model_combo.addItem(model_id, model_id)
+
+            # Try to restore previous selection
+            current_text = self.config.get('model', 'deepseek/deepseek-chat-v3-0324')
+            index = self.model_combo.findData(current_text)
+            if index >= 0:
+                self.model_combo.setCurrentIndex(index)
+            else:
+                self.model_combo.setCurrentText(current_text)
+        self.model_combo.setUpdatesEnabled(True)
+        self.on_model_changed(self.model_combo.currentText())
 
     def on_providers_fetched(self, model_id, providers):
         """Handle fetched providers."""
@@ -1263,27 +1602,16 @@ class EpubTranslatorApp(QMainWindow):
     def on_provider_details_fetched(self, model_id, provider_details):
         """Handle fetched provider details."""
         self.current_provider_details = provider_details
-        self.available_providers_list.clear()
-
-        for detail in provider_details:
-            display_text = (f"{detail['provider_id']} | "
-                            f"{detail['pricing']} | "
-                            f"ctx:{detail['context_length']} | "
-                            f"{detail['quantization']} | "
-                            f"uptime:{detail['uptime']}")
-
-            item = QListWidgetItem(display_text)
-            item.setData(Qt.UserRole, detail['provider_id'])
+        provider_list = self.available_providers_list
 
-            tooltip = (f"Provider: {detail['provider_name']}\n"
-                       f"ID: {detail['provider_id']}\n"
-                       f"Pricing: {detail['pricing']}\n"
-                       f"Context Length: {detail['context_length']}\n"
-                       f"Quantization: {detail['quantization']}\n"
-                       f"Uptime (30m): {detail['uptime']}")
-            item.setToolTip(tooltip)
-
-            self.available_providers_list.addItem(item)
+        # Build every item first and insert them under a single repaint
+        provider_list.setUpdatesEnabled(False)
+        with QSignalBlocker(provider_list):
+            provider_list.clear()
+            for detail in provider_details:
+                provider_list.addItem(_ProviderListItem(detail))
+        provider_list.setUpdatesEnabled(True)
+        provider_list.update()
 
         self.api_status_label.setText(f"Found {len(provider_details)} providers for {model_id}")
 
@@ -1304,76 +1632,87 @@ class EpubTranslatorApp(QMainWindow):
 
     def add_provider(self):
         """Add selected providers to the selected list."""
+        selected_ids = self._selected_provider_ids
+        added = []
         for item in self.available_providers_list.selectedItems():
+            # on_provider_details_fetched stores the id on every item
             provider_id = item.data(Qt.UserRole)
-            if not provider_id:
-                provider_id = item.text().split(' | ')[0]
 
             # Check if already in selected list
-            found = False
-            for i in range(self.selected_providers_list.count()):
-                if self.selected_providers_list.item(i).text() == provider_id:
-                    found = True
-                    break
+            if provider_id not in selected_ids:
+                selected_ids.add(provider_id)
+                added.append(provider_id)
 
-            if not found:
-                self.selected_providers_list.addItem(provider_id)
+        if added:
+            self._set_selected_providers(self._selected_providers_model.stringList() + added)
 
     def remove_provider(self):
         """Remove selected providers from the selected list."""
-        for item in self.selected_providers_list.selectedItems():
-            row = self.selected_providers_list.row(item)
-            self.selected_providers_list.takeItem(row)
+        rows = set(self._selected_provider_rows())
+        if not rows:
+            return
+        providers = self._selected_providers_model.stringList()
+        self._set_selected_providers([p for i, p in enumerate(providers) if i not in rows])
 
     def move_provider_up(self):
         """Move selected provider up in the list."""
-        selected_items = self.selected_providers_list.selectedItems()
-        if not selected_items:
+        rows = self._selected_provider_rows()
+        if not rows:
             return
 
-        for item in selected_items:
-            row = self.selected_providers_list.row(item)
-            if row > 0:
-                self.selected_providers_list.takeItem(row)
-                self.selected_providers_list.insertItem(row - 1, item)
-                item.setSelected(True)
+        providers = self._selected_providers_model.stringList()
+        new_rows = []
+        for row in rows:
+            if row > 0 and row - 1 not in new_rows:
+                providers[row - 1], providers[row] = providers[row], providers[row - 1]
+                row -= 1
+            new_rows.append(row)
+        self._set_selected_providers(providers, new_rows)
 
     def move_provider_down(self):
         """Move selected provider down in the list."""
-        selected_items = self.selected_providers_list.selectedItems()
-        if not selected_items:
+        rows = self._selected_provider_rows()
+        if not rows:
             return
 
-        for item in reversed(selected_items):
-            row = self.selected_providers_list.row(item)
-            if row < self.selected_providers_list.count() - 1:
-                self.selected_providers_list.takeItem(row)
-                self.selected_providers_list.insertItem(row + 1, item)
-                item.setSelected(True)
+        providers = self._selected_providers_model.stringList()
+        new_rows = []
+        for row in reversed(rows):
+            if row < len(providers) - 1 and row + 1 not in new_rows:
+                providers[row + 1], providers[row] = providers[row], providers[row + 1]
+                row += 1
+            new_rows.append(row)
+        self._set_selected_providers(providers, new_rows)
+
+    def _selected_provider_rows(self):
+        """Rows currently selected in the selected-providers view, ascending."""
+        return sorted(index.row() for index in self.selected_providers_list.selectionModel().selectedRows())
+
+    def _set_selected_providers(self, providers, selected_rows=()):
+        """Replace the selected-providers list and reselect the given rows."""
+        self._selected_providers_model.setStringList(providers)
+        self._selected_provider_ids = set(providers)
+        selection = self.selected_providers_list.selectionModel()
+        for row in selected_rows:
+            selection.select(self._selected_providers_model.index(row),
+                             QItemSelectionModel.Select)
+        # setStringList() clears the selection without emitting selectionChanged
+        self.update_provider_buttons()
 
     def update_provider_buttons(self):
         """Enable/disable provider movement buttons based on selection."""
-        selected_items = self.selected_providers_list.selectedItems()
-        if not selected_items:
+        rows = self._selected_provider_rows()
+        if not rows:
             self.move_up_btn.setEnabled(False)
             self.move_down_btn.setEnabled(False)
             return
 
-        can_move_up = any(self.selected_providers_list.row(item) > 0 for item in selected_items)
-        self.move_up_btn.setEnabled(can_move_up)
-
-        can_move_down = any(
-            self.selected_providers_list.row(item) < self.selected_providers_list.count() - 1
-            for item in selected_items
-        )
-        self.move_down_btn.setEnabled(can_move_down)
+        self.move_up_btn.setEnabled(rows[-1] > 0)
+        self.move_down_btn.setEnabled(rows[0] < self._selected_providers_model.rowCount() - 1)
 
     def get_selected_providers(self):
         """Get list of selected providers in order."""
-        providers = []
-        for i in range(self.selected_providers_list.count()):
-            providers.append(self.selected_providers_list.item(i).text())
-        return providers
+        return self._selected_providers_model.stringList()
 
     # ==================== File/EPUB Methods ====================
 
@@ -1385,49 +1724,109 @@ class EpubTranslatorApp(QMainWindow):
             self.load_epub_file(epub_path)
 
     def load_epub_file(self, epub_path):
-        """Load EPUB file and extract chapters."""
+        """Load EPUB file and extract chapters.
+
+        The EPUB is parsed on the thread pool and applied by
+        _on_epub_load_finished; a newer load supersedes an older one.
+        """
         if not os.path.exists(epub_path):
             return
 
-        try:
-            self.epub_path = epub_path  # Store for rebuilding
-            self.epub_book = epub.read_epub(epub_path)
-            self.chapters = [item.content.decode('utf-8')
-                             for item in self.epub_book.get_items() if isinstance(item, epub.EpubHtml)]
-
-            epub_name = os.path.splitext(os.path.basename(epub_path))[0]
+        # Already loading this file
+        if epub_path == self._pending_epub_path:
+            return
 
-            # Truncate long names for display
-            display_name = epub_name
-            if len(display_name) > 30:
-                display_name = display_name[:27] + "..."
+        self._pending_epub_path = epub_path
 
-            self.total_chapters_label.setText(f"📚 {display_name} | Chapters: {len(self.chapters)}")
-            self.total_chapters_label.setToolTip(f"Full name: {epub_name}\nChapters: {len(self.chapters)}")
+        # An unchanged EPUB's chapter list is shown from the manifest cache
+        # right away; the full parse still runs for the chapter contents
+        manifest = load_manifest(epub_path)
+        titles = manifest['titles'] if manifest else None
+        if titles is not None:
+            epub_name = os.path.splitext(os.path.basename(epub_path))[0]
+            self._call_with_tabs(self._show_manifest_titles, epub_path, epub_name, titles)
 
-            output_folder = os.path.join(os.path.dirname(__file__), "..", "..", "..", f"{epub_name}_translated")
+        QThreadPool.globalInstance().start(_EpubLoadJob(epub_path, self._epub_load_signals, titles))
+        QTimer.singleShot(EPUB_LOAD_INDICATOR_DELAY_MS, self._show_epub_loading)
 
-            # Update file paths
-            context_folder = os.path.join(output_folder, "context")
-            self.current_character_file = os.path.join(context_folder, f"{epub_name}_characters.json")
-            self.current_place_file = os.path.join(context_folder, f"{epub_name}_places.json")
-            self.current_terms_file = os.path.join(context_folder, f"{epub_name}_terms.json")
-            self.current_notes_file = os.path.join(context_folder, f"{epub_name}_notes.json")
-            self.current_toc_file = os.path.join(context_folder, f"{epub_name}_toc.json")
+    def _show_manifest_titles(self, epub_path, epub_name, titles):
+        """Fill the chapter overview from cached manifest titles."""
+        self.chapter_overview.update_epub_info(epub_path, [], epub_name, titles=titles)
 
-            # Update chapter overview
-            self.chapter_overview.update_epub_info(epub_path, self.chapters, epub_name)
+    def _show_epub_loading(self):
+        """Show a busy label if a background load is still running."""
+        if self._pending_epub_path:
+            self.total_chapters_label.setText("⏳ Loading EPUB...")
 
-            # Load and display existing files
-            self.update_all_displays()
+    def _on_epub_load_finished(self, epub_path, book, html_items, chapters, titles):
+        if epub_path != self._pending_epub_path:
+            return
+        self._pending_epub_path = None
+        self._call_with_tabs(self._apply_loaded_epub, epub_path, book, html_items, chapters, titles)
 
+    def _apply_loaded_epub(self, epub_path, book, html_items, chapters, titles):
+        try:
+            self._on_epub_loaded(epub_path, book, html_items, chapters, titles)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load EPUB file: {str(e)}")
 
+    def _on_epub_load_failed(self, epub_path, error):
+        if epub_path != self._pending_epub_path:
+            return
+        self._pending_epub_path = None
+        self.total_chapters_label.setText("No EPUB loaded")
+        QMessageBox.critical(self, "Error", f"Failed to load EPUB file: {error}")
+
+    def _on_epub_loaded(self, epub_path, book, html_items, chapters, titles=None):
+        """Apply a parsed EPUB to the window state and displays."""
+        self.epub_path = epub_path  # Store for rebuilding
+        self.epub_book = book
+        self._html_items = html_items
+        self.chapters = chapters
+
+        epub_name = os.path.splitext(os.path.basename(epub_path))[0]
+
+        # Truncate long names for display
+        display_name = epub_name
+        if len(display_name) > 30:
+            display_name = display_name[:27] + "..."
+
+        self.total_chapters_label.setText(f"📚 {display_name} | Chapters: {len(self.chapters)}")
+        self.total_chapters_label.setToolTip(f"Full name: {epub_name}\nChapters: {len(self.chapters)}")
+
+        self.epub_name = epub_name
+        self.output_folder = str(PROJECT_ROOT / f"{epub_name}_translated")
+        self.context_folder = os.path.join(self.output_folder, "context")
+
+        # Update file paths
+        self._set_context_paths(epub_name)
+
+        # Update chapter overview
+        self.chapter_overview.update_epub_info(epub_path, self.chapters, epub_name, titles=titles)
+
+        # Load and display existing files
+        self.update_all_displays()
+
+    def _set_context_paths(self, epub_name):
+        """Point the current_*_file paths at epub_name's context folder."""
+        if epub_name == self._context_paths_name:
+            return
+        context_folder = self.context_folder
+        self.current_character_file = os.path.join(context_folder, f"{epub_name}_characters.json")
+        self.current_place_file = os.path.join(context_folder, f"{epub_name}_places.json")
+        self.current_terms_file = os.path.join(context_folder, f"{epub_name}_terms.json")
+        self.current_notes_file = os.path.join(context_folder, f"{epub_name}_notes.json")
+        self.current_toc_file = os.path.join(context_folder, f"{epub_name}_toc.json")
+        self._context_paths_name = epub_name
+
     # ==================== Translation Methods ====================
 
     def start_translation(self):
         """Start the translation process."""
+        if self._pending_epub_path:
+            QMessageBox.warning(self, "Warning", "EPUB is still loading, please wait.")
+            return
+
         if not self.chapters:
             QMessageBox.warning(self, "Warning", "No EPUB file loaded!")
             return
@@ -1485,59 +1884,55 @@ class EpubTranslatorApp(QMainWindow):
             'api_key': api_key,
         }
 
-        # Get selected chapters
+        # Get selected chapters. Only the numbers are queued; workers decode
+        # each chapter from self.chapters when they reach it
         if self.range_radio.isChecked():
             try:
                 start = int(self.start_chapter_entry.text())
                 end = int(self.end_chapter_entry.text())
-                selected_chapters = self.chapters[start - 1:end]
-                chapter_numbers = list(range(start, end + 1))
+                chapter_numbers = list(range(max(start, 1), min(end, len(self.chapters)) + 1))
             except ValueError:
                 QMessageBox.warning(self, "Error", "Invalid chapter range!")
                 return
         else:
             try:
-                chapter_numbers = []
-                parts = self.csv_entry.text().split(',')
-                for part in parts:
-                    part = part.strip()
-                    if '-' in part:
-                        start_range, end_range = map(int, part.split('-'))
-                        chapter_numbers.extend(range(start_range, end_range + 1))
-                    else:
-                        chapter_numbers.append(int(part))
-                selected_chapters = [self.chapters[i - 1] for i in chapter_numbers]
+                csv_text = self.csv_entry.text()
+                # Anything besides ranges, commas and spaces is a typo
+                if _CSV_RANGE_RE.sub('', csv_text).strip(', \t'):
+                    raise ValueError(csv_text)
+                # Overlapping ranges are merged so no chapter is queued twice
+                seen = set()
+                for first, last in _CSV_RANGE_RE.findall(csv_text):
+                    seen.update(range(int(first), int(last or first) + 1))
+                if not seen:
+                    raise ValueError(csv_text)
+                chapter_numbers = sorted(seen)
+                if chapter_numbers[0] < 1 or chapter_numbers[-1] > len(self.chapters):
+                    raise IndexError(chapter_numbers)
             except (ValueError, IndexError):
                 QMessageBox.warning(self, "Error", "Invalid chapter numbers!")
                 return
 
         # Set up chapter queue
-        chapter_queue = queue.Queue()
-        for chap_num, chapter in zip(chapter_numbers, selected_chapters):
-            chapter_queue.put((chap_num, chapter))
+        chapter_queue = AtomicChapterIter(chapter_numbers)
 
-        # Set up output folder
-        epub_path = self.epub_path_entry.text()
-        epub_name = os.path.splitext(os.path.basename(epub_path))[0]
-        output_folder = os.path.join(os.path.dirname(__file__), "..", "..", "..", f"{epub_name}_translated")
-        os.makedirs(output_folder, exist_ok=True)
+        # Output paths were worked out when the EPUB loaded; the folder only
+        # needs creating once per session
+        epub_name = self.epub_name
+        output_folder = self.output_folder
+        if output_folder not in self._created_output_folders:
+            os.makedirs(output_folder, exist_ok=True)
+            self._created_output_folders.add(output_folder)
 
         # Update file paths
-        context_folder = os.path.join(output_folder, "context")
-        self.current_character_file = os.path.join(context_folder, f"{epub_name}_characters.json")
-        self.current_place_file = os.path.join(context_folder, f"{epub_name}_places.json")
-        self.current_terms_file = os.path.join(context_folder, f"{epub_name}_terms.json")
-        self.current_notes_file = os.path.join(context_folder, f"{epub_name}_notes.json")
-        self.current_toc_file = os.path.join(context_folder, f"{epub_name}_toc.json")
+        self._set_context_paths(epub_name)
 
         # Load existing files
         self.update_all_displays()
 
         # Get chunk tokens
-        try:
-            chunk_tokens = int(self.max_tokens_entry.text())
-        except ValueError:
-            chunk_tokens = 7000
+        chunk_text = self.max_tokens_entry.text().strip()
+        chunk_tokens = int(chunk_text) if chunk_text.isdecimal() else 7000
 
         # Determine number of workers
         num_workers = self.concurrency_spin.value()
@@ -1601,53 +1996,55 @@ class EpubTranslatorApp(QMainWindow):
                 json_output_mode=json_output_mode,
             )
 
-            thread = threading.Thread(target=worker.run, daemon=True)
-
-            # Connect signals
-            worker.update_progress.connect(
-                lambda text, wid, color, log=log_widget: self.update_progress(text, wid, color, log)
-            )
+            # Connect signals (progress text is polled by _drain_worker_progress)
             worker.status_updated.connect(self.update_worker_status)
             worker.finished.connect(self.cleanup_worker)
-            worker.characters_updated.connect(self.update_character_display)
-            worker.places_updated.connect(self.update_place_display)
-            worker.terms_updated.connect(self.update_terms_display)
-            worker.notes_updated.connect(self.update_notes_display)
+            worker.characters_updated.connect(self._schedule_display_refresh)
+            worker.places_updated.connect(self._schedule_display_refresh)
+            worker.terms_updated.connect(self._schedule_display_refresh)
+            worker.notes_updated.connect(self._schedule_display_refresh)
             worker.raw_json_updated.connect(self.update_raw_json_display)
             worker.chapter_completed.connect(self.on_chapter_completed)
             worker.toc_entry_translated.connect(self.on_toc_entry_translated)
 
             self.workers[worker_id] = {
-                'thread': thread,
                 'worker': worker,
                 'log': log_widget,
                 'tab_index': self.tabs.count() - 1
             }
 
             self.tabs.setTabText(self.workers[worker_id]['tab_index'], f"Worker {worker_id + 1} ▶")
-            thread.start()
+            threading.Thread(target=worker.run, daemon=True).start()
+
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
 
     def stop_translation(self):
         """Stop all translation workers."""
+        # Workers check their stop flag between requests and stream chunks,
+        # so they are left to exit on their own instead of being joined. Their
+        # logs keep draining until they finish.
         for worker_id, w in self.workers.items():
             w['worker'].stop()
-
-        # Join with a short timeout so the GUI doesn't freeze
-        for worker_id, w in list(self.workers.items()):
-            w['thread'].join(timeout=2.0)
-            if w['thread'].is_alive():
-                tab_index = w.get('tab_index')
-                if tab_index is not None:
-                    self.tabs.setTabText(tab_index, f"Worker {worker_id + 1} ⏳ stopping...")
+            tab_index = w.get('tab_index')
+            if tab_index is not None:
+                self.tabs.setTabText(tab_index, f"Worker {worker_id + 1} ⏳ stopping...")
+        self._stopping_workers.update(self.workers)
         self.workers.clear()
 
     def create_tab(self, worker_id):
         """Create a tab for a worker."""
+        return self._make_log_tab(f"Worker {worker_id + 1}")
+
+    def _make_log_tab(self, title):
+        """Add a tab holding a read-only log view and return the view."""
         scroll = QScrollArea()
         content = QWidget()
-        text_edit = QTextEdit()
+        text_edit = QPlainTextEdit()
         text_edit.setReadOnly(True)
-        text_edit.setFont(QFont("Consolas", 9))
+        text_edit.setFont(self._LOG_FONT)
+        text_edit.setUndoRedoEnabled(False)
+        text_edit.setMaximumBlockCount(LOG_MAX_BLOCKS)
 
         layout = QVBoxLayout()
         layout.addWidget(text_edit)
@@ -1656,25 +2053,55 @@ class EpubTranslatorApp(QMainWindow):
         scroll.setWidget(content)
         scroll.setWidgetResizable(True)
 
-        self.tabs.addTab(scroll, f"Worker {worker_id + 1}")
+        self.tabs.addTab(scroll, title)
         return text_edit
 
-    def update_progress(self, text, worker_id, color, log_widget):
-        """Update progress text in worker tab."""
-        cursor = log_widget.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-
-        format_table = {
-            "red": Qt.GlobalColor.red,
-            "green": Qt.GlobalColor.darkGreen,
-            "blue": Qt.GlobalColor.blue,
-            "black": Qt.GlobalColor.black,
-            "orange": Qt.GlobalColor.darkYellow,
-            "gray": Qt.GlobalColor.gray,
-        }
+    def _drain_worker_progress(self):
+        """Move queued progress messages from each worker into its log tab."""
+        if not self.workers and not self._stopping_workers:
+            self._progress_timer.stop()
+            return
+        for w in [*self.workers.values(), *self._stopping_workers.values()]:
+            self._flush_worker_progress(w, PROGRESS_ITEMS_PER_TICK)
+
+    def _flush_worker_progress(self, w, max_items=None):
+        """Write up to max_items queued messages (all if None) for one worker.
 
-        log_widget.setTextColor(format_table.get(color, Qt.GlobalColor.black))
-        cursor.insertText(text)
+        Consecutive messages in the same color are joined into one run so the
+        log gets a single insert per run and one scroll per flush.
+        """
+        runs = []
+        for text, _worker_id, color in w['worker'].take_progress(max_items):
+            if runs and runs[-1][1] == color:
+                runs[-1][0].append(text)
+            else:
+                runs.append(([text], color))
+        if runs:
+            self._append_log_runs(w['log'], [(''.join(parts), color) for parts, color in runs])
+
+    # Worker log color names -> Qt colors
+    _LOG_COLOR_TABLE = {
+        "red": Qt.GlobalColor.red,
+        "green": Qt.GlobalColor.darkGreen,
+        "blue": Qt.GlobalColor.blue,
+        "black": Qt.GlobalColor.black,
+        "orange": Qt.GlobalColor.darkYellow,
+        "yellow": Qt.GlobalColor.darkYellow,
+        "cyan": Qt.GlobalColor.cyan,
+        "white": Qt.GlobalColor.black,
+        "gray": Qt.GlobalColor.gray,
+    }
+
+    def _append_log_runs(self, log_widget, runs):
+        """Append (text, color) runs to a log widget and scroll to the end once."""
+        colors = self._LOG_COLOR_TABLE
+        char_format = QTextCharFormat()
+        # Write through the widget's own cursor so the format applies to the run
+        log_widget.moveCursor(QTextCursor.MoveOperation.End)
+        for text, color in runs:
+            char_format.setForeground(colors.get(color, Qt.GlobalColor.black))
+            log_widget.setCurrentCharFormat(char_format)
+            log_widget.insertPlainText(text)
         log_widget.ensureCursorVisible()
 
     def update_worker_status(self, worker_id, chapter_number, current_chunk, total_chunks):
@@ -1686,7 +2113,13 @@ class EpubTranslatorApp(QMainWindow):
 
     def cleanup_worker(self, worker_id):
         """Clean up worker after completion."""
+        stopped = self._stopping_workers.pop(worker_id, None)
+        if stopped is not None:
+            self._flush_worker_progress(stopped)
+            self.tabs.setTabText(stopped['tab_index'], f"Worker {worker_id + 1} ⏹ stopped")
+            return
         if worker_id in self.workers:
+            self._flush_worker_progress(self.workers[worker_id])
             tab_index = self.workers[worker_id]['tab_index']
             self.tabs.setTabText(tab_index, f"Worker {worker_id + 1} ✓")
             del self.workers[worker_id]
@@ -1707,18 +2140,9 @@ class EpubTranslatorApp(QMainWindow):
         if not self.epub_book:
             return {}
 
-        from ebooklib import epub
-
-        # Get ordered list of HTML items (same order as self.chapters)
-        html_items = [
-            item for item in self.epub_book.get_items()
-            if isinstance(item, epub.EpubHtml)
-        ]
-
         # Build reverse mapping: file_name -> chapter_number
-        file_to_chapter = {}
-        for i, item in enumerate(html_items, start=1):
-            file_to_chapter[item.file_name] = i
+        # (_html_items is in the same order as self.chapters)
+        file_to_chapter = {item.file_name: i for i, item in enumerate(self._html_items, start=1)}
 
         # Recursively collect all TOC entries
         def collect_toc_links(toc_item, results):
@@ -1776,7 +2200,7 @@ class EpubTranslatorApp(QMainWindow):
             })
 
         # Update TOC tab
-        self.toc_tab.append(f"[Ch.{chapter_number}] {original} → {translated}")
+        self.toc_tab.appendPlainText(f"[Ch.{chapter_number}] {original} → {translated}")
 
     def _apply_inline_toc_translations(self, book, toc_translations):
         """Apply inline TOC translations to the book's TOC structure.
@@ -1818,14 +2242,16 @@ class EpubTranslatorApp(QMainWindow):
             return
 
         try:
-            from ..core.epub_rebuilder import EpubRebuilder
-
-            epub_name = os.path.splitext(os.path.basename(self.epub_path))[0]
-            output_folder = os.path.join(os.path.dirname(__file__), "..", "..", "..", f"{epub_name}_translated")
+            epub_name = self.epub_name
+            output_folder = self.output_folder
             xhtml_folder = os.path.join(output_folder, "xhtml")
 
             # Check if xhtml folder exists and has files
-            if not os.path.exists(xhtml_folder) or not os.listdir(xhtml_folder):
+            try:
+                has_xhtml = bool(os.listdir(xhtml_folder))
+            except OSError:
+                has_xhtml = False
+            if not has_xhtml:
                 logger.warning("No translated XHTML files found, skipping EPUB rebuild")
                 return
 
@@ -1840,13 +2266,11 @@ class EpubTranslatorApp(QMainWindow):
             logger.info(f"Updated {len(translated_map)} chapters in EPUB")
 
             # Load inline TOC translations from disk
-            toc_path = os.path.join(output_folder, "context", f"{epub_name}_toc.json")
+            toc_path = self.current_toc_file
             inline_toc = {}
             if os.path.exists(toc_path):
                 try:
-                    with open(toc_path, 'r', encoding='utf-8') as f:
-                        inline_toc = json.load(f)
-                        inline_toc = {int(k): v for k, v in inline_toc.items()}
+                    inline_toc = {int(k): v for k, v in json_io.load_file(toc_path).items()}
                 except Exception as e:
                     logger.warning(f"Could not load inline TOC translations: {e}")
 
@@ -1881,9 +2305,6 @@ class EpubTranslatorApp(QMainWindow):
 
     def _build_epub_with_batch_toc(self, rebuilder, output_folder, epub_name, translated_map):
         """Fall back to the old batch TOC translation approach."""
-        from ..core.toc_translation_worker import TocTranslationWorker
-        from ..core.context_manager import ContextManager
-
         # Create TOC translation tab
         toc_log_widget = self.create_tab_for_toc()
 
@@ -1912,8 +2333,7 @@ class EpubTranslatorApp(QMainWindow):
 
         selected_providers = []
         if provider.can_fetch_providers:
-            for i in range(self.selected_providers_list.count()):
-                selected_providers.append(self.selected_providers_list.item(i).text())
+            selected_providers = self.get_selected_providers()
             if not selected_providers:
                 selected_providers = provider.get_provider_list([])
 
@@ -1963,157 +2383,235 @@ class EpubTranslatorApp(QMainWindow):
         # Create thread
         toc_thread = threading.Thread(target=self.toc_worker.run, daemon=True)
 
-        # Connect signals
-        self.toc_worker.update_progress.connect(
-            lambda text, color, log=toc_log_widget: self.update_toc_progress(text, color, log)
-        )
-        self.toc_worker.raw_json_updated.connect(self.update_raw_json_display)
-        self.toc_worker.toc_item_translated.connect(self.update_toc_item_status)
-        self.toc_worker.finished.connect(
-            lambda success, msg: self.on_toc_translation_finished(success, msg, rebuilder, output_folder, epub_name)
-        )
-
         # Store worker reference
         self.toc_thread = toc_thread
         self.toc_log_widget = toc_log_widget
+        self._toc_build = (rebuilder, output_folder, epub_name)
+
+        # Connect signals. The worker emits from toc_thread; the slots are
+        # methods of this window, so Qt queues them onto the GUI thread based
+        # on the receiver's thread rather than on how a callable was wrapped
+        self.toc_worker.update_progress.connect(self._on_toc_progress)
+        self.toc_worker.raw_json_updated.connect(self.update_raw_json_display)
+        self.toc_worker.toc_item_translated.connect(self.update_toc_item_status)
+        self.toc_worker.finished.connect(self._on_toc_worker_finished)
 
         # Start TOC translation
-        print("🔄 Starting TOC Translation in separate thread...")
+        logger.info("Starting TOC translation in separate thread")
         toc_thread.start()
 
     def create_tab_for_toc(self):
         """Create a tab for TOC translation."""
-        scroll = QScrollArea()
-        content = QWidget()
-        text_edit = QTextEdit()
-        text_edit.setReadOnly(True)
-        text_edit.setFont(QFont("Consolas", 9))
-
-        layout = QVBoxLayout()
-        layout.addWidget(text_edit)
-        content.setLayout(layout)
+        log_widget = self._make_log_tab("📚 TOC Translation")
+        self._toc_tab_page = self.tabs.widget(self.tabs.count() - 1)
+        self._toc_tab_title = "📚 TOC Translation"
+        return log_widget
 
-        scroll.setWidget(content)
-        scroll.setWidgetResizable(True)
+    def _on_toc_progress(self, text, color):
+        self.update_toc_progress(text, color, self.toc_log_widget)
 
-        self.tabs.addTab(scroll, "📚 TOC Translation")
-        return text_edit
+    def _on_toc_worker_finished(self, success, message):
+        rebuilder, output_folder, epub_name = self._toc_build
+        self.on_toc_translation_finished(success, message, rebuilder, output_folder, epub_name)
 
     def update_toc_progress(self, text, color, log_widget):
         """Update TOC progress text in tab."""
-        cursor = log_widget.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-
-        format_table = {
-            "red": Qt.GlobalColor.red,
-            "green": Qt.GlobalColor.darkGreen,
-            "blue": Qt.GlobalColor.blue,
-            "black": Qt.GlobalColor.black,
-            "orange": Qt.GlobalColor.darkYellow,
-            "yellow": Qt.GlobalColor.darkYellow,
-            "cyan": Qt.GlobalColor.cyan,
-            "white": Qt.GlobalColor.black,
-            "gray": Qt.GlobalColor.gray,
-        }
+        self._append_log_runs(log_widget, [(text, color)])
 
-        log_widget.setTextColor(format_table.get(color, Qt.GlobalColor.black))
-        cursor.insertText(text)
-        log_widget.ensureCursorVisible()
+    def _set_toc_tab_title(self, title):
+        # Looked up from the cached page; tabs before it may have been closed.
+        # Repeated progress signals with the same title are no-ops
+        if self._toc_tab_page is not None and title != self._toc_tab_title:
+            self._toc_tab_title = title
+            self.tabs.setTabText(self.tabs.indexOf(self._toc_tab_page), title)
 
     def update_toc_item_status(self, current, total, original, translated):
         """Update the TOC translation tab title with progress."""
         progress_pct = int((current / total) * 100) if total > 0 else 0
-        # Find the TOC tab and update its title
-        for i in range(self.tabs.count()):
-            if "TOC Translation" in self.tabs.tabText(i):
-                self.tabs.setTabText(i, f"📚 TOC Translation ({current}/{total} - {progress_pct}%)")
-                break
+        self._set_toc_tab_title(f"📚 TOC Translation ({current}/{total} - {progress_pct}%)")
 
     def on_toc_translation_finished(self, success, message, rebuilder, output_folder, epub_name):
-        """Handle TOC translation completion."""
-        from PySide6.QtWidgets import QMessageBox
-
-        # Update tab title
-        for i in range(self.tabs.count()):
-            if "TOC Translation" in self.tabs.tabText(i):
-                if success:
-                    self.tabs.setTabText(i, "📚 TOC Translation ✓")
-                else:
-                    self.tabs.setTabText(i, "📚 TOC Translation ❌")
-                break
+        """Handle TOC translation completion.
 
+        The EPUB is zipped on a pool thread; the tab title and the completion
+        box wait for _on_toc_epub_written.
+        """
         if success:
-            try:
-                # Write final EPUB
-                output_epub = os.path.join(output_folder, f"{epub_name}_translated.epub")
-                rebuilder.write_epub(output_epub)
-
-                logger.info(f"Translated EPUB created: {output_epub}")
-
-                QMessageBox.information(
-                    self,
-                    "EPUB Build Complete",
-                    f"EPUB built successfully!\n\nTranslated EPUB saved to:\n{output_epub}"
-                )
-            except Exception as e:
-                logger.error(f"Error writing EPUB: {e}", exc_info=True)
-                QMessageBox.warning(
-                    self,
-                    "EPUB Write Error",
-                    f"TOC translation succeeded but EPUB write failed:\n{str(e)}"
-                )
+            self._set_toc_tab_title("📚 TOC Translation (writing EPUB...)")
+            output_epub = os.path.join(output_folder, f"{epub_name}_translated.epub")
+            QThreadPool.globalInstance().start(
+                _EpubWriteTask(rebuilder, output_epub, self._epub_write_signals))
         else:
+            self._set_toc_tab_title("📚 TOC Translation ❌")
             QMessageBox.warning(
                 self,
                 "TOC Translation Failed",
                 f"TOC translation failed: {message}\n\nTranslated XHTML files are available in the output folder."
             )
 
+    def _on_toc_epub_written(self, success, result):
+        """Report the outcome of the background EPUB write."""
+        if success:
+            self._set_toc_tab_title("📚 TOC Translation ✓")
+            logger.info(f"Translated EPUB created: {result}")
+            QMessageBox.information(
+                self,
+                "EPUB Build Complete",
+                f"EPUB built successfully!\n\nTranslated EPUB saved to:\n{result}"
+            )
+        else:
+            self._set_toc_tab_title("📚 TOC Translation ❌")
+            QMessageBox.warning(
+                self,
+                "EPUB Write Error",
+                f"TOC translation succeeded but EPUB write failed:\n{result}"
+            )
+
     # ==================== Display Update Methods ====================
 
     def update_all_displays(self):
         """Update all display tabs."""
-        self.update_character_display()
-        self.update_place_display()
-        self.update_terms_display()
-        self.update_notes_display()
-        self.update_toc_display()
+        self._display_refresh_timer.stop()
+        with self._batch_ui():
+            self.update_character_display()
+            self.update_place_display()
+            self.update_terms_display()
+            self.update_notes_display()
+            self.update_toc_display()
+
+    def _schedule_display_refresh(self):
+        """(Re)start the refresh timer; a burst of context saves refreshes once."""
+        self._display_refresh_timer.start()
+
+    @contextlib.contextmanager
+    def _batch_ui(self):
+        """Hold off repaints of the display tabs until the outermost block exits."""
+        widgets = [tab for tab in (self.character_tab, self.place_tab, self.terms_tab,
+                                   self.notes_tab, self.toc_tab) if tab is not None]
+        self._batch_ui_depth += 1
+        if self._batch_ui_depth == 1:
+            for widget in widgets:
+                widget.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self._batch_ui_depth -= 1
+            if self._batch_ui_depth == 0:
+                for widget in widgets:
+                    widget.setUpdatesEnabled(True)
+                    widget.update()
+
+    @staticmethod
+    def _file_stamp(path):
+        """(st_mtime_ns, st_size) of path, or None if it does not exist."""
+        try:
+            st = os.stat(path)
+        except (OSError, ValueError):
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _display_is_current(self, key, tab, path, file_stamp):
+        """Whether tab already shows path as stamped; records it if not.
+
+        A missing file (stamp None) counts as its own state, so the "no data"
+        text is not re-rendered either.
+        """
+        shown = self._display_stamps.get(key)
+        if shown is not None and shown[0] is tab and shown[1:] == (path, file_stamp):
+            return True
+        self._display_stamps[key] = (tab, path, file_stamp)
+        return False
+
+    def _load_json_cached(self, path, file_stamp):
+        """Parse a context file, reusing the last parse while its stamp holds.
+
+        Large files are handed to a _ContextLoadJob and None is returned;
+        _on_context_loaded re-renders once the parse is in.
+        """
+        cached = self._display_cache.get(path)
+        if cached is not None and cached[0] == file_stamp:
+            if isinstance(cached[1], Exception):
+                raise cached[1]
+            return cached[1]
+        if file_stamp[1] >= BACKGROUND_PARSE_MIN_BYTES:
+            if path not in self._context_loads_pending:
+                self._context_loads_pending.add(path)
+                QThreadPool.globalInstance().start(
+                    _ContextLoadJob(path, file_stamp, self._context_load_signals))
+            return None
+        data = json_io.load_file(path)
+        self._display_cache[path] = (file_stamp, data)
+        return data
+
+    def _on_context_loaded(self, path, file_stamp, data):
+        """Cache a background parse and re-render the tabs showing that file."""
+        self._context_loads_pending.discard(path)
+        self._display_cache[path] = (file_stamp, data)
+        # Those tabs were marked current when the parse was started
+        self._display_stamps = {key: shown for key, shown in self._display_stamps.items()
+                                if shown[1] != path}
+        self.update_all_displays()
+
+    @staticmethod
+    def _set_display_text(tab, text):
+        """Show text in tab through a freshly built document.
+
+        Filling a new document and swapping it in lets Qt drop the old one
+        wholesale instead of clearing and re-laying it out in place.
+        setDocument() only deletes the editor's original document, so a
+        previously swapped-in one (parented to tab) is deleted here.
+        """
+        old_document = tab.document()
+        if old_document.parent() is not tab:
+            old_document = None  # Owned and deleted by the editor itself
+        document = QTextDocument(tab)
+        document.setDocumentLayout(QPlainTextDocumentLayout(document))
+        document.setDefaultFont(tab.font())
+        document.setPlainText(text)
+        tab.setDocument(document)
+        if old_document is not None:
+            old_document.deleteLater()
 
     def update_character_display(self):
         """Update character display tab."""
-        if os.path.exists(self.current_character_file):
+        if self.character_tab is None:
+            return
+        path = self.current_character_file
+        file_stamp = self._file_stamp(path)
+        if self._display_is_current('character', self.character_tab, path, file_stamp):
+            return
+        if file_stamp is not None:
             try:
-                import json
-                from ..core.context_manager import format_character_name
-                with open(self.current_character_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                lines = []
-                for orig, char_data in data.items():
-                    if isinstance(char_data, dict) and 'first_name' in char_data:
-                        name_str = format_character_name(char_data)
-                        gender = char_data.get('gender', 'not_clear')
-                        lines.append(f"{orig} : {name_str} : {gender}")
-                    else:
-                        lines.append(f"{orig} : (invalid entry) : not_clear")
-                self.character_tab.setPlainText("\n".join(lines))
+                data = self._load_json_cached(path, file_stamp)
+                if data is None:
+                    return  # Parsing on the pool
+                self._set_display_text(self.character_tab, "\n".join([
+                    f"{orig} : {format_character_name(char_data)} : {char_data.get('gender', 'not_clear')}"
+                    if isinstance(char_data, dict) and 'first_name' in char_data
+                    else f"{orig} : (invalid entry) : not_clear"
+                    for orig, char_data in data.items()
+                ]))
             except Exception as e:
-                import traceback
-                traceback.print_exc()
+                logger.exception("Error loading character file")
                 self.character_tab.setPlainText(f"Error loading character file: {str(e)}")
         else:
             self.character_tab.setPlainText("No character data available yet.")
 
     def update_place_display(self):
         """Update place display tab."""
-        if os.path.exists(self.current_place_file):
+        if self.place_tab is None:
+            return
+        path = self.current_place_file
+        file_stamp = self._file_stamp(path)
+        if self._display_is_current('place', self.place_tab, path, file_stamp):
+            return
+        if file_stamp is not None:
             try:
-                import json
-                with open(self.current_place_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                lines = []
-                for orig, trans in data.items():
-                    lines.append(f"{orig} : {trans}")
-                self.place_tab.setPlainText("\n".join(lines))
+                data = self._load_json_cached(path, file_stamp)
+                if data is None:
+                    return  # Parsing on the pool
+                self._set_display_text(
+                    self.place_tab, "\n".join([f"{orig} : {trans}" for orig, trans in data.items()]))
             except Exception as e:
                 self.place_tab.setPlainText(f"Error loading place file: {str(e)}")
         else:
@@ -2121,20 +2619,23 @@ class EpubTranslatorApp(QMainWindow):
 
     def update_terms_display(self):
         """Update terms display tab."""
-        if os.path.exists(self.current_terms_file):
+        if self.terms_tab is None:
+            return
+        path = self.current_terms_file
+        file_stamp = self._file_stamp(path)
+        if self._display_is_current('terms', self.terms_tab, path, file_stamp):
+            return
+        if file_stamp is not None:
             try:
-                import json
-                with open(self.current_terms_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                lines = []
-                for orig, term_data in data.items():
-                    if isinstance(term_data, dict):
-                        trans = term_data['translated']
-                        category = term_data['category']
-                        lines.append(f"{orig} : {trans} : {category}")
-                    else:
-                        lines.append(f"{orig} : {term_data} : other")
-                self.terms_tab.setPlainText("\n".join(lines))
+                data = self._load_json_cached(path, file_stamp)
+                if data is None:
+                    return  # Parsing on the pool
+                self._set_display_text(self.terms_tab, "\n".join([
+                    f"{orig} : {term_data['translated']} : {term_data['category']}"
+                    if isinstance(term_data, dict)
+                    else f"{orig} : {term_data} : other"
+                    for orig, term_data in data.items()
+                ]))
             except Exception as e:
                 self.terms_tab.setPlainText(f"Error loading terms file: {str(e)}")
         else:
@@ -2142,15 +2643,19 @@ class EpubTranslatorApp(QMainWindow):
 
     def update_notes_display(self):
         """Update notes display tab."""
-        if os.path.exists(self.current_notes_file):
+        if self.notes_tab is None:
+            return
+        path = self.current_notes_file
+        file_stamp = self._file_stamp(path)
+        if self._display_is_current('notes', self.notes_tab, path, file_stamp):
+            return
+        if file_stamp is not None:
             try:
-                import json
-                with open(self.current_notes_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                lines = []
-                for key, note in data.items():
-                    lines.append(f"{key} = {note}")
-                self.notes_tab.setPlainText("\n".join(lines))
+                data = self._load_json_cached(path, file_stamp)
+                if data is None:
+                    return  # Parsing on the pool
+                self._set_display_text(
+                    self.notes_tab, "\n".join([f"{key} = {note}" for key, note in data.items()]))
             except Exception as e:
                 self.notes_tab.setPlainText(f"Error loading notes file: {str(e)}")
         else:
@@ -2158,35 +2663,52 @@ class EpubTranslatorApp(QMainWindow):
 
     def update_toc_display(self):
         """Update TOC display tab from saved TOC translations."""
-        if self.current_toc_file and os.path.exists(self.current_toc_file):
+        file_stamp = self._file_stamp(self.current_toc_file)
+        if self._display_is_current('toc', self.toc_tab, self.current_toc_file, file_stamp):
+            return
+        # Not cached: on_toc_entry_translated edits the entries in place
+        if file_stamp is not None:
             try:
-                with open(self.current_toc_file, 'r', encoding='utf-8') as f:
-                    toc_data = json.load(f)
+                toc_data = json_io.load_file(self.current_toc_file)
                 self.toc_translations = {int(k): v for k, v in toc_data.items()}
-                lines = []
-                for ch_num in sorted(self.toc_translations.keys()):
-                    for entry in self.toc_translations[ch_num]:
-                        original = entry.get('original', '')
-                        translated = entry.get('translated', '')
-                        lines.append(f"[Ch.{ch_num}] {original} → {translated}")
-                self.toc_tab.setPlainText("\n".join(lines))
+                self._set_display_text(self.toc_tab, "\n".join([
+                    f"[Ch.{ch_num}] {entry.get('original', '')} → {entry.get('translated', '')}"
+                    for ch_num in sorted(self.toc_translations)
+                    for entry in self.toc_translations[ch_num]
+                ]))
             except Exception as e:
                 self.toc_tab.setPlainText(f"Error loading TOC file: {str(e)}")
         else:
             self.toc_tab.setPlainText("No TOC translations available yet.")
 
-    def update_raw_json_display(self, raw_json):
-        """Update the raw JSON display with the latest response."""
-        current_text = self.raw_json_tab.toPlainText()
-        if current_text:
-            separator = "\n" + "=" * 80 + "\n"
-            new_text = current_text + separator + raw_json
-        else:
-            new_text = raw_json
+    def update_raw_json_display(self, raw_json_gz):
+        """Queue the latest gzip-compressed response for the raw JSON tab.
 
-        self.raw_json_tab.setPlainText(new_text)
+        Payloads stay compressed until the tab is actually viewed; while it
+        is, a burst of responses is appended and scrolled to in one flush.
+        """
+        if self.raw_json_tab is None and 'raw_json_tab' not in self._tab_placeholders.values():
+            # Tab was closed; it is never rebuilt, so nothing will show these
+            self._pending_raw_json.clear()
+            return
+        self._pending_raw_json.append(raw_json_gz)
+        if (self.raw_json_tab is not None and self.tabs.currentWidget() is self.raw_json_tab
+                and not self._raw_json_flush_timer.isActive()):
+            self._raw_json_flush_timer.start()
+
+    def _flush_raw_json_display(self):
+        """Decompress pending responses and append them to the raw JSON tab."""
+        if self.raw_json_tab is None or not self._pending_raw_json:
+            return
+        raw_json_tab = self.raw_json_tab
+        separator = "=" * 80
+        # Appending keeps each flush proportional to the new responses rather
+        # than to everything already shown
+        for payload in self._pending_raw_json:
+            if not raw_json_tab.document().isEmpty():
+                raw_json_tab.appendPlainText(separator)
+            raw_json_tab.appendPlainText(gzip.decompress(payload).decode('utf-8'))
+        self._pending_raw_json.clear()
 
         # Scroll to bottom
-        cursor = self.raw_json_tab.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        self.raw_json_tab.setTextCursor(cursor)
+        raw_json_tab.moveCursor(QTextCursor.MoveOperation.End)
@@ -1,5 +1,5 @@
 """Utility functions and classes for the translator."""
 
-from .token_counter import num_tokens_from_string, split_chapter
+from .token_counter import num_tokens_batch, num_tokens_from_string, split_chapter
 
-__all__ = ['num_tokens_from_string', 'split_chapter']
+__all__ = ['num_tokens_batch', 'num_tokens_from_string', 'split_chapter']
@@ -0,0 +1,48 @@
+"""On-disk cache of per-EPUB chapter manifests (chapter count and titles)."""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional
+
+from . import json_io
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path.home() / ".epub-translator" / "cache"
+
+
+def _manifest_path(epub_path: str) -> Path:
+    digest = hashlib.sha1(os.path.abspath(epub_path).encode('utf-8')).hexdigest()
+    return CACHE_DIR / f"{digest}.json"
+
+
+def _file_key(epub_path: str) -> List[int]:
+    st = os.stat(epub_path)
+    return [st.st_mtime_ns, st.st_size]
+
+
+def load_manifest(epub_path: str) -> Optional[dict]:
+    """Return the cached manifest for epub_path if the file is unchanged, else None."""
+    try:
+        key = _file_key(epub_path)
+        manifest = json_io.load_file(_manifest_path(epub_path))
+    except (OSError, ValueError):
+        return None
+    if manifest.get('key') != key or not isinstance(manifest.get('titles'), list):
+        return None
+    return manifest
+
+
+def save_manifest(epub_path: str, titles: List[str]) -> None:
+    """Record the chapter titles for epub_path, keyed on its (mtime, size)."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        json_io.dump_file(_manifest_path(epub_path), {
+            'path': os.path.abspath(epub_path),
+            'key': _file_key(epub_path),
+            'titles': titles,
+        })
+    except OSError as e:
+        logger.warning(f"Could not write EPUB manifest cache: {e}")
@@ -0,0 +1,77 @@
+"""JSON serialization helpers, using orjson when it is installed."""
+
+import json
+import os
+from typing import Any, Iterator, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional, for streaming large files
+    ijson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch this either way
+JSONDecodeError = json.JSONDecodeError
+
+READ_BUFFER_SIZE = 256 * 1024
+
+
+def loads(data) -> Any:
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, optionally indented by two spaces."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def load_file(path) -> Any:
+    """Read a whole JSON file in one buffered binary read and parse it."""
+    with open(path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+        return loads(f.read())
+
+
+def iter_object_items(path) -> Iterator[Tuple[str, Any]]:
+    """Yield the key/value pairs of a file holding one JSON object.
+
+    With ijson installed the file is streamed pair by pair; otherwise it is
+    parsed whole and its items are yielded.
+    """
+    if ijson is not None:
+        with open(path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+            yield from ijson.kvitems(f, '', use_float=True)
+    else:
+        yield from load_file(path).items()
+
+
+def dump_file(path, obj: Any, indent: bool = False) -> None:
+    """Serialize obj and write it to path in a single buffered write.
+
+    The data goes to a sibling temp file that then replaces path, so a crash
+    mid-write never leaves a truncated file behind.
+    """
+    data = dumps(obj, indent=indent)
+    tmp_path = f"{os.fspath(path)}.tmp"
+    try:
+        with open(tmp_path, 'wb', buffering=READ_BUFFER_SIZE) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
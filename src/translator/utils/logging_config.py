@@ -1,10 +1,91 @@
 """Logging configuration for the translator application."""
 
+import atexit
 import logging
+import queue
 import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
+LOG_MAX_BYTES = 10_000_000
+LOG_BACKUP_COUNT = 3
+LOG_BATCH_SIZE = 64
+LOG_FLUSH_INTERVAL = 2.0
+
+# Background thread that writes queued records to the real handlers
+_queue_listener: Optional[QueueListener] = None
+
+
+class BatchedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that writes records in batches.
+
+    Records are formatted and encoded as they arrive, then written with one
+    write and flush per batch_size records. A background thread flushes
+    whatever is buffered every flush_interval seconds, and a record at
+    flush_level or above flushes at once, so warnings and errors reach the
+    file before a crash. Rollover is checked per batch, so a file can
+    overshoot maxBytes by at most one batch.
+    """
+
+    def __init__(self, filename, maxBytes=0, backupCount=0, encoding=None,
+                 batch_size=LOG_BATCH_SIZE, flush_level=logging.WARNING,
+                 flush_interval=LOG_FLUSH_INTERVAL):
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount,
+                         encoding=encoding)
+        self.batch_size = batch_size
+        self.flush_level = flush_level
+        self.flush_interval = flush_interval
+        self._buffer = []
+        self._closed = threading.Event()
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop, name='log-flush', daemon=True
+        )
+        self._flush_thread.start()
+
+    def _open(self):
+        # Batches are encoded once in emit(), so the file takes bytes
+        return open(self.baseFilename, 'ab')
+
+    def _flush_loop(self):
+        while not self._closed.wait(self.flush_interval):
+            self.flush()
+
+    def emit(self, record):
+        try:
+            line = self.format(record) + self.terminator
+            self._buffer.append(line.encode(self.encoding or 'utf-8', self.errors or 'strict'))
+            if len(self._buffer) >= self.batch_size or record.levelno >= self.flush_level:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self._buffer:
+                data = b''.join(self._buffer)
+                self._buffer.clear()
+                if self.stream is None:
+                    self.stream = self._open()
+                if self.maxBytes > 0:
+                    self.stream.seek(0, 2)
+                    if self.stream.tell() and self.stream.tell() + len(data) >= self.maxBytes:
+                        self.doRollover()
+                        if self.stream is None:
+                            self.stream = self._open()
+                self.stream.write(data)
+            super().flush()
+        finally:
+            self.release()
+
+    def close(self):
+        self._closed.set()
+        if self._flush_thread is not threading.current_thread():
+            self._flush_thread.join()
+        super().close()
+
 
 def setup_logging(
     log_file: Optional[str] = None,
@@ -17,7 +98,14 @@ def setup_logging(
         log_file: Path to log file. If None, logs only to console
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         console: Whether to also log to console
+
+    Callers only enqueue records; a QueueListener thread does the formatting
+    and the file/console writes. File writes are batched, and the log file
+    rotates at LOG_MAX_BYTES.
     """
+    global _queue_listener
+    shutdown_logging()
+
     # Create formatters
     detailed_formatter = logging.Formatter(
         fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -33,23 +121,32 @@ def setup_logging(
 
     # Remove existing handlers to avoid duplicates
     root_logger.handlers.clear()
+    handlers = []
 
     # Add file handler if log file specified
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        file_handler = logging.FileHandler(log_path, encoding='utf-8')
+        file_handler = BatchedRotatingFileHandler(
+            log_path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8'
+        )
         file_handler.setLevel(level)
         file_handler.setFormatter(detailed_formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
     # Add console handler if requested
     if console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
         console_handler.setFormatter(console_formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    if handlers:
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(QueueHandler(log_queue))
+        _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _queue_listener.start()
 
     # Set third-party loggers to WARNING to reduce noise
     logging.getLogger('ebooklib').setLevel(logging.WARNING)
@@ -59,6 +156,19 @@ def setup_logging(
     logging.info("Logging configured successfully")
 
 
+def shutdown_logging() -> None:
+    """Flush queued log records and stop the background logging thread."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+atexit.register(shutdown_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance for the given name.
 
@@ -0,0 +1,6 @@
+"""Filesystem locations shared across the application."""
+
+from pathlib import Path
+
+# Project root: config files and translated output folders live here
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
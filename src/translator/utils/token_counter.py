@@ -1,30 +1,52 @@
 """Token counting and text chunking utilities."""
 
-from typing import List
+from functools import lru_cache
+from typing import Iterable, List
 import tiktoken
 
 
+@lru_cache(maxsize=8)
+def _get_encoding(encoding_name: str) -> tiktoken.Encoding:
+    """Look up a tiktoken encoding once per name."""
+    return tiktoken.get_encoding(encoding_name)
+
+
 def num_tokens_from_string(string: str, encoding_name: str) -> int:
     """Count the number of tokens in a string."""
-    encoding = tiktoken.get_encoding(encoding_name)
-    return len(encoding.encode(string))
+    return len(_get_encoding(encoding_name).encode(string))
+
+
+def num_tokens_batch(strings: Iterable[str], encoding_name: str) -> List[int]:
+    """Count the tokens of several strings in one batched encode call."""
+    return [len(tokens) for tokens in
+            _get_encoding(encoding_name).encode_ordinary_batch(list(strings))]
 
 
 def split_chapter(chapter: str, max_tokens: int) -> List[str]:
-    """Split a chapter into chunks based on token count."""
-    chunks = []
+    """Split a chapter into chunks based on token count.
+
+    Each line is tokenized once, in a single batch call, and chunks are
+    filled from a running total instead of re-encoding the growing chunk
+    for every line. A chunk's count is the sum of its lines' counts, which
+    can only overestimate the tokens of the joined text.
+    """
     lines = chapter.split('\n')
-    current_chunk = ""
+    line_tokens = num_tokens_batch((line + '\n' for line in lines), 'cl100k_base')
 
-    for line in lines:
-        chunk_tokens = num_tokens_from_string(current_chunk + line + '\n', 'cl100k_base')
-        if chunk_tokens > max_tokens:
-            chunks.append(current_chunk.strip())
-            current_chunk = line + '\n'
+    chunks = []
+    current_lines = []
+    current_tokens = 0
+
+    for line, tokens in zip(lines, line_tokens):
+        if current_lines and current_tokens + tokens > max_tokens:
+            chunks.append('\n'.join(current_lines).strip())
+            current_lines = [line]
+            current_tokens = tokens
         else:
-            current_chunk += line + '\n'
+            current_lines.append(line)
+            current_tokens += tokens
 
-    if current_chunk:
-        chunks.append(current_chunk.strip())
+    if current_lines:
+        chunks.append('\n'.join(current_lines).strip())
 
     return chunks